@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import inspect
 import json
-from typing import List, Optional, Type, Any, Callable, TypeVar, Generic
+from collections import OrderedDict
+from typing import List, Optional, Type, Any, Awaitable, Callable, TypeVar, Generic, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -11,12 +14,26 @@ from llm_patch_driver.llm.schemas import ToolCallResponse, Message
 from llm_patch_driver.patch.base_patch import PatchBundle
 from llm_patch_driver.patch_target.target import PatchTarget
 from llm_patch_driver.llm.base_tool import LLMTool
-from llm_patch_driver.driver.prompts import REQUEST_PATCH_PROMPT, PATCHING_LOOP_SYSTEM_PROMPT
-from llm_patch_driver.llm import OpenAIChatCompletions
+from llm_patch_driver.driver.prompts import REQUEST_PATCH_PROMPT, PATCHING_LOOP_SYSTEM_PROMPT, PATCH_SYNTAX_PROMPT
+from llm_patch_driver.llm.openai_adapters import OpenAIChatCompletions
 
 T = TypeVar("T", bound=Any)
 U = TypeVar("U", bound=BaseModel)
 
+def _approx_token_count(text: str) -> int:
+    """Rough token estimate (~4 characters per token for English text)."""
+    return len(text) // 4
+
+def _as_async(method: Callable) -> Callable[..., Awaitable[Any]]:
+    """Return ``method`` if it is a coroutine function, otherwise an awaitable wrapper."""
+    if inspect.iscoroutinefunction(method):
+        return method
+
+    async def _call(**kwargs: Any) -> Any:
+        return method(**kwargs)
+
+    return _call
+
 class PatchDriver(Generic[T]):
     """Orchestrates patching process.
 
@@ -35,6 +52,10 @@ class PatchDriver(Generic[T]):
       output (``schema``) is requested. May be sync or async.
     - **model_args**: Optional provider/model-specific kwargs forwarded to the
       adapter on each LLM call.
+    - **request_model_args**: Optional kwargs merged over ``model_args`` for
+      ``request_patch_bundle`` calls only. Use it to bound patch generation
+      separately from loop turns, e.g. ``{"max_tokens": 1024, "timeout": 30}``
+      for OpenAI clients.
     - **api_adapter**: Concrete implementation of ``BaseApiAdapter`` that
       formats inputs and parses outputs for the chosen LLM API.
     - **tools**: Optional list of ``LLMTool`` classes to pre-bind. When not
@@ -42,6 +63,23 @@ class PatchDriver(Generic[T]):
       direct patch application) and adjusted to the active patch type.
     - **max_cycles**: Upper bound of iterations in the patching loop to prevent
       unbounded retries.
+    - **keep_state_history**: When ``True`` (default), superseded debugging
+      states stay in the loop history with their annotated data replaced by a
+      placeholder. When ``False`` they are dropped from the history entirely,
+      so later cycles send fewer tokens.
+    - **patch_cache_size**: Number of patch bundles memoised by
+      ``request_patch_bundle``, keyed on the rendered request prompt (query,
+      context and annotated content). ``0`` (default) disables the cache. A hit
+      replays a previous LLM answer, so enable it only with deterministic
+      sampling.
+    - **max_prompt_tokens**: Optional token budget for a single LLM call. When
+      set, every call is checked before it is sent and a ``ValueError`` is
+      raised if the prompt (messages, tool schemas and response schema) exceeds
+      the budget, instead of paying for a request the provider will reject.
+      Leave room for the response when choosing it.
+    - **token_counter**: Callable returning the number of tokens in a string,
+      used with ``max_prompt_tokens``. Defaults to a ~4 characters per token
+      estimate; pass an exact tokenizer (e.g. ``tiktoken``) for tight budgets.
 
     Methods:
     - ``run_patching_loop(message_history)``: Runs the iterative loop; executes
@@ -49,6 +87,8 @@ class PatchDriver(Generic[T]):
       becomes valid or ``max_cycles`` is reached.
     - ``request_patch_bundle(query, context)``: Requests a ``PatchBundle`` from
       the LLM given the annotated content and developer-provided context.
+    - ``request_patch_bundles(requests)``: Requests several bundles
+      concurrently against the same state and merges them into one.
     - ``bind_tool(tool)``: Registers a tool class. Its schema is adapted via the
       active ``api_adapter`` so the LLM can invoke it.
 
@@ -70,28 +110,42 @@ class PatchDriver(Generic[T]):
         api_adapter: BaseApiAdapter = OpenAIChatCompletions(),
         tools: List[Type[LLMTool]] | None = None,
         max_cycles: int = 25,
+        keep_state_history: bool = True,
+        patch_cache_size: int = 0,
+        request_model_args: dict | None = None,
+        max_prompt_tokens: int | None = None,
+        token_counter: Callable[[str], int] = _approx_token_count,
     ):
         
         self.api_adapter = api_adapter
         self.target_object = target_object
 
-        self._create_method = create_method
-        self._parse_method = parse_method
+        # sync/async is resolved once so call_llm always awaits
+        self._create_method = _as_async(create_method)
+        self._parse_method = _as_async(parse_method)
         self._model_args = model_args if model_args is not None else {}
+        self._request_model_args = request_model_args if request_model_args is not None else {}
         self._max_cycles = max_cycles
+        self._keep_state_history = keep_state_history
+        self._patch_cache_size = patch_cache_size
+        self._patch_cache: OrderedDict[bytes, PatchBundle] = OrderedDict()
+        self._max_prompt_tokens = max_prompt_tokens
+        self._token_counter = token_counter
 
         # prompts prebuilt
 
-        loop_prompt = PATCHING_LOOP_SYSTEM_PROMPT.format(
-            patch_syntax=self.target_object.patch_type.prompts.syntax
-            )
-        loop_prompt_message = Message(
-            role="system",
-            content=loop_prompt
+        self._patch_syntax = self.target_object.patch_type.prompts.syntax
+
+        # the syntax goes in its own message so the loop prompt stays identical
+        # across patch types and each block can be cached by the provider
+        syntax_prompt = PATCH_SYNTAX_PROMPT.substitute(
+            patch_syntax=self._patch_syntax
             )
-        
-        self._loop_prompt_message = loop_prompt_message
-        self._request_prompt = (REQUEST_PATCH_PROMPT + "\n" + self.target_object.patch_type.prompts.syntax)
+
+        self._loop_prompt_messages = [
+            Message(role="system", content=PATCHING_LOOP_SYSTEM_PROMPT),
+            Message(role="system", content=syntax_prompt),
+        ]
 
         self._tool_map = {} # lookup table tool_name:tool
         self._tools = [] # list of tool schemas to be passed to the LLM
@@ -126,7 +180,7 @@ class PatchDriver(Generic[T]):
 
         original_messages = self.api_adapter.parse_messages(message_history)
         object_to_patch = self.target_object
-        current_messages = original_messages + [self._loop_prompt_message]
+        current_messages = original_messages + self._loop_prompt_messages
 
         num_cycles = 0
         while object_to_patch.current_error:
@@ -137,9 +191,9 @@ class PatchDriver(Generic[T]):
             )
 
             # remove current state and keep only error message in the message history
-            current_messages.extend(
-                [object_to_patch.debugging_message_placeholder, message]
-                )
+            if self._keep_state_history:
+                current_messages.append(object_to_patch.debugging_message_placeholder)
+            current_messages.append(message)
 
             for tool_call in message.tool_calls:
                 tool_func = self._tool_map[tool_call.name]
@@ -189,26 +243,79 @@ class PatchDriver(Generic[T]):
 
         object_to_patch = self.target_object
 
-        prompt = self._request_prompt.format(
+        prompt = REQUEST_PATCH_PROMPT.substitute(
             query=query, 
             context=context, 
-            text=object_to_patch.annotated_content
+            text=object_to_patch.annotated_content,
+            patch_syntax=self._patch_syntax
             )
+
+        cache_key = None
+        if self._patch_cache_size:
+            cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+            if (cached_bundle := self._patch_cache.get(cache_key)) is not None:
+                self._patch_cache.move_to_end(cache_key)
+                return cached_bundle
         
         request_schema = object_to_patch.patch_type.get_bundle_schema()
         
         message = await self.call_llm(
             schema=request_schema, 
-            messages=[Message(role="system", content=prompt)]
+            messages=[Message(role="system", content=prompt)],
+            model_args=self._request_model_args
         )
 
         patch_bundle = request_schema.model_validate(
             message.attached_object, 
             context={"id_content_map": object_to_patch._lookup_map}
             )
+
+        if cache_key is not None:
+            self._patch_cache[cache_key] = patch_bundle
+            if len(self._patch_cache) > self._patch_cache_size:
+                self._patch_cache.popitem(last=False)
         
         return patch_bundle
 
+    async def request_patch_bundles(
+        self, 
+        requests: List[Tuple[str, str]], 
+        max_concurrency: int = 4
+        ) -> PatchBundle:
+        """Request several patches concurrently and merge them into one bundle.
+
+        Args:
+            requests: List of ``(query, context)`` pairs. Each pair is sent as a
+                separate ``request_patch_bundle`` call.
+            max_concurrency: Maximum number of LLM calls in flight at once.
+
+        Usage recommendation:
+            The object has several independent problems. All requests are built
+            from the same annotated state, so the merged bundle can be applied
+            with a single ``apply_patches`` call. Queries must target
+            non-overlapping parts of the object.
+
+        Notes:
+            - Requests only overlap in time when ``parse_method`` is async.
+            - Patches are merged by the patch type's ``merge_patches``, which raises
+              ``ValueError`` when patches from different requests cannot be merged,
+              e.g. because they touch the same part of the object.
+        """
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _request(query: str, context: str) -> PatchBundle:
+            async with semaphore:
+                return await self.request_patch_bundle(query, context)
+
+        bundles = await asyncio.gather(*(_request(query, context) for query, context in requests))
+
+        patch_type = self.target_object.patch_type
+        patches = patch_type.merge_patches([bundle.patches for bundle in bundles], self.target_object)
+
+        request_schema = patch_type.get_bundle_schema()
+        return request_schema(patches=patches)
+
     def bind_tool(self, tool: Type[LLMTool]):
         """Add a tool to the patch driver.
         
@@ -235,7 +342,8 @@ class PatchDriver(Generic[T]):
         messages: List[Message], 
         tools: Optional[List[dict]] = None, 
         system_prompt: Optional[str] = None,
-        schema: Optional[Type[U]] = None
+        schema: Optional[Type[U]] = None,
+        model_args: Optional[dict] = None
         ) -> Message:
         """Create a message from the LLM.
         
@@ -244,7 +352,11 @@ class PatchDriver(Generic[T]):
             tools: List of tools to be passed to the LLM.
             system_prompt: System prompt to be passed to the LLM.
             schema: Schema to be passed to the LLM.
+            model_args: Per-call kwargs merged over the driver's ``model_args``.
         """
+
+        if self._max_prompt_tokens is not None:
+            self._check_prompt_budget(messages, system_prompt, tools, schema)
         
         # Format inputs using the adapter
         llm_call_input = self.api_adapter.format_llm_call_input(
@@ -256,30 +368,46 @@ class PatchDriver(Generic[T]):
         
         # Add model args
         llm_call_input.update(self._model_args)
+        if model_args:
+            llm_call_input.update(model_args)
 
-        is_object_required = schema is not None
-        is_create_async = inspect.iscoroutinefunction(self._create_method)
-        is_parse_async = inspect.iscoroutinefunction(self._parse_method)
-
-        match (is_object_required, is_create_async, is_parse_async):
-
-            case (True, _, True):
-                raw_response = await self._parse_method(**llm_call_input)
-    
-            case (True, _, False):
-                raw_response = self._parse_method(**llm_call_input)
-
-            case (False, True, _):
-                raw_response = await self._create_method(**llm_call_input)
-
-            case (False, False, _):
-                raw_response = self._create_method(**llm_call_input)
+        llm_method = self._parse_method if schema is not None else self._create_method
+        raw_response = await llm_method(**llm_call_input)
         
         # Parse response using adapter
         message = self.api_adapter.parse_llm_output(raw_response)
         
         return message
 
+    def _check_prompt_budget(
+        self,
+        messages: List[Message],
+        system_prompt: Optional[str],
+        tools: Optional[List[dict]] = None,
+        schema: Optional[Type[BaseModel]] = None,
+        ) -> None:
+        """Raise if the prompt is estimated to exceed ``max_prompt_tokens``.
+
+        Tool and response schemas are sent with the prompt, so they count too.
+        """
+
+        parts = [system_prompt or ""]
+        parts.extend(json.dumps(tool, default=str) for tool in tools or [])
+        if schema is not None:
+            parts.append(json.dumps(schema.model_json_schema()))
+        for message in messages:
+            if isinstance(message, ToolCallResponse):
+                parts.append(message.output)
+                continue
+            content = message.content
+            parts.append(content if isinstance(content, str) else json.dumps(content, default=str))
+            parts.extend(tool_call.arguments for tool_call in message.tool_calls)
+
+        num_tokens = self._token_counter("\n".join(parts))
+        if num_tokens > self._max_prompt_tokens:
+            raise ValueError(
+                f"Prompt has {num_tokens} tokens, exceeding max_prompt_tokens ({self._max_prompt_tokens})."
+            )
 
     def _build_tools(self) -> List[Type[LLMTool]]:
         """Build tools for the patch driver.
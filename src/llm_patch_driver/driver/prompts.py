@@ -1,4 +1,7 @@
-REQUEST_PATCH_PROMPT = """
+from string import Template
+from textwrap import dedent
+
+REQUEST_PATCH_PROMPT = Template(dedent("""
 <role>
 You are a professional editor specialised in programmatic text refactoring. 
 Given an original text and a modification request, your task is to emit a JSON object 
@@ -19,19 +22,20 @@ with patch operations that will transform the text so it satisfies the request.
 3. The <annotated_data> section is the current state of the object that was augmented with a set of tags to help you modify it. If it is a text, it was annotated with <tid> tags. If it is a JSON, it was annotated with <a> and <i> tags. Use these IDs to generate patches. Only you see these tags. They will dissapear after the patching process.
 
 <query>
-{query}
+$query
 </query>
 
 <context>
-{context}
+$context
 </context>
 
 <annotated_data>
-{text}
+$text
 </annotated_data>
-"""
 
-PATCHING_LOOP_SYSTEM_PROMPT = """
+$patch_syntax""").strip())
+
+PATCHING_LOOP_SYSTEM_PROMPT = dedent("""
 # THE RESPONSE HAS NOT BEEN APPROVED BY THE SYSTEM. ENTERING DEBUGGING MODE TO FIX THE RESPONSE
 
 <what_happened>
@@ -78,9 +82,12 @@ Good debugging means:
     - Request a patch from the LLM if the modification is too complex for you to provide it yourself.
     - Provide a patch yourself if the modification is simple enough.
     - Reset the data to the original state if you want to start over.
+    The patch syntax is provided in the next message.
 </tools>
+""").strip()
 
+PATCH_SYNTAX_PROMPT = Template(dedent("""
 <patch_syntax>
-{patch_syntax}
+$patch_syntax
 </patch_syntax>
-"""
\ No newline at end of file
+""").strip())
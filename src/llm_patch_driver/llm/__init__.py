@@ -1,21 +1,43 @@
-"""LLM client wrapper and related types."""
-
-from .base_adapter import BaseApiAdapter
-from .openai_adapters import OpenAIChatCompletions, OpenAIResponses
-from .google_adapters import GoogleGenAiAdapter
-from .litellm_adapters import LiteLLMChatCompletions
-from .schemas import ToolCallRequest, ToolCallResponse, Message, ToolSchema
-from .base_tool import LLMTool
-
-__all__ = [
-    "BaseApiAdapter",
-    "OpenAIChatCompletions",
-    "OpenAIResponses",
-    "GoogleGenAiAdapter",
-    "LiteLLMChatCompletions",
-    "ToolCallRequest",
-    "ToolCallResponse",
-    "Message",
-    "ToolSchema",
-    "LLMTool",
-]
\ No newline at end of file
+"""LLM client wrapper and related types.
+
+Names are resolved lazily (PEP 562), so importing the package only loads the
+adapter modules that are actually used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base_adapter import BaseApiAdapter
+    from .openai_adapters import OpenAIChatCompletions, OpenAIResponses
+    from .google_adapters import GoogleGenAiAdapter
+    from .litellm_adapters import LiteLLMChatCompletions
+    from .schemas import ToolCallRequest, ToolCallResponse, Message, ToolSchema
+    from .base_tool import LLMTool
+
+_EXPORTS = {
+    "BaseApiAdapter": ".base_adapter",
+    "OpenAIChatCompletions": ".openai_adapters",
+    "OpenAIResponses": ".openai_adapters",
+    "GoogleGenAiAdapter": ".google_adapters",
+    "LiteLLMChatCompletions": ".litellm_adapters",
+    "ToolCallRequest": ".schemas",
+    "ToolCallResponse": ".schemas",
+    "Message": ".schemas",
+    "ToolSchema": ".schemas",
+    "LLMTool": ".base_tool",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
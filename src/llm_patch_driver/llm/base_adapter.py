@@ -9,6 +9,7 @@ import inspect
 from functools import partial
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Callable
 
 from pydantic import BaseModel
@@ -18,6 +19,34 @@ from llm_patch_driver.llm.schemas import ToolCallRequest, ToolCallResponse, Mess
 U = TypeVar("U", bound=BaseModel)
 
 
+_MISSING = object()
+
+
+def get_field(obj: Any, name: str, default: Any = None) -> Any:
+    """Read a single key from a provider payload, which may be a dict or an SDK object."""
+    if isinstance(obj, Mapping):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def get_path(obj: Any, path: Tuple[str | int, ...], default: Any = None) -> Any:
+    """Follow keys, attributes and list indices through a provider payload.
+
+    Returns ``default`` as soon as a step is missing.
+    """
+    for step in path:
+        if isinstance(step, int):
+            try:
+                obj = obj[step]
+            except (IndexError, KeyError, TypeError):
+                return default
+        else:
+            obj = get_field(obj, step, _MISSING)
+            if obj is _MISSING:
+                return default
+    return obj
+
+
 class BaseApiAdapter(ABC):
     """Abstract base class for LLM API adapters.
     
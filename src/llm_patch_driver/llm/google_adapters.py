@@ -25,9 +25,8 @@ from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 import json
 
 from pydantic import BaseModel
-from glom import glom
 
-from llm_patch_driver.llm.base_adapter import BaseApiAdapter
+from llm_patch_driver.llm.base_adapter import BaseApiAdapter, get_field
 from llm_patch_driver.llm.schemas import (
     Message,
     ToolCallRequest,
@@ -38,6 +37,49 @@ from llm_patch_driver.llm.schemas import (
 U = TypeVar("U", bound=BaseModel)
 
 
+def _format_content(msg: Union[Message, ToolCallResponse]) -> Dict[str, Any]:
+    """Format a Message or ToolCallResponse as a Gemini Content dict."""
+
+    if isinstance(msg, ToolCallResponse):
+        function_response_part = {
+            "functionResponse": {
+                "name": msg.request.name,
+                "response": {
+                    "name": msg.request.name,
+                    "content": [{"text": str(msg.output)}],
+                },
+            }
+        }
+        return {"role": "tool", "parts": [function_response_part]}
+
+    # normalize role without mutating the caller's message
+    role = "user" if msg.role == "system" else msg.role
+
+    parts = []
+
+    # parse message content
+    if msg.content:
+        if isinstance(msg.content, str):
+            parts.append({"text": msg.content})
+        else:
+            parts.append(msg.content) # type: ignore
+
+    # parse tool calls
+    for tc in msg.tool_calls:
+        try:
+            args_obj = json.loads(tc.arguments)
+        except Exception:
+            args_obj = {"arguments": tc.arguments}
+        parts.append({
+            "functionCall": {
+                "name": tc.name,
+                "args": args_obj
+            }
+        })
+
+    return {"role": role, "parts": parts}
+
+
 class GoogleGenAiAdapter(BaseApiAdapter):
     """Adapter for Google Gemini models.generateContent.
 
@@ -56,57 +98,7 @@ class GoogleGenAiAdapter(BaseApiAdapter):
         Returns a dict of keyword arguments suitable for the google-genai client.
         """
 
-        contents = []
-
-        for msg in messages:
-
-            match msg:
-
-                case ToolCallResponse():
-                    function_response_part = {
-                        "functionResponse": {
-                            "name": msg.request.name,
-                            "response": {
-                                "name": msg.request.name,
-                                "content": [{"text": str(msg.output)}],
-                            },
-                        }
-                    }
-                    contents.append({
-                        "role": "tool",
-                        "parts": [function_response_part],
-                    })
-                    continue
-
-                case Message():
-                    # normalize role
-                    if msg.role == "system":
-                        msg.role = "user"
-
-                    parts = []
-
-                    # parse message content
-                    if msg.content:
-                        if isinstance(msg.content, str):
-                            parts.append({"text": msg.content})
-                        else:
-                            parts.append(msg.content) # type: ignore
-
-                    # parse tool calls
-                    if msg.tool_calls:
-                        for tc in msg.tool_calls:
-                            try:
-                                args_obj = json.loads(tc.arguments)
-                            except Exception:
-                                args_obj = {"arguments": tc.arguments}
-                            parts.append({
-                                "functionCall": {
-                                    "name": tc.name,
-                                    "args": args_obj
-                                }
-                            })
-
-                    contents.append({"role": msg.role, "parts": parts})
+        contents = [_format_content(msg) for msg in messages]
 
         model_params: Dict[str, Any] = {"contents": contents}
 
@@ -152,16 +144,16 @@ class GoogleGenAiAdapter(BaseApiAdapter):
         `parsed` if present for structured output.
         """
 
-        content_text = glom(raw_response, "text", default="")
-        structured_output = glom(raw_response, "parsed", default=None)
-        fn_calls = glom(raw_response, "function_calls", default=[]) or []
+        content_text = get_field(raw_response, "text", "")
+        structured_output = get_field(raw_response, "parsed")
+        fn_calls = get_field(raw_response, "function_calls", []) or []
 
         # Extract function calls directly from the response surface
         tool_calls: List[ToolCallRequest] = []
         
         for fc in fn_calls:
-            name = glom(fc, "name", default="")
-            args = glom(fc, "args", default={})
+            name = get_field(fc, "name", "")
+            args = get_field(fc, "args", {})
 
             if isinstance(args, (dict, list)):
                 try:
@@ -201,15 +193,15 @@ class GoogleGenAiAdapter(BaseApiAdapter):
                 parsed.append(msg)
                 continue
 
-            role = glom(msg, "role", default="user")
+            role = get_field(msg, "role", "user")
             if role == "system":
                 role = "user"
 
             # Gemini Content does not have a top-level `content`; it has `parts`.
-            parts = glom(msg, "parts", default=[])
+            parts = get_field(msg, "parts", [])
             text_fragments: List[str] = []
             for part in parts:
-                text_value = glom(part, "text", default=None)
+                text_value = get_field(part, "text")
                 if isinstance(text_value, str):
                     text_fragments.append(text_value)
 
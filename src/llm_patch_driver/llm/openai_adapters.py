@@ -5,13 +5,112 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Type, TypeVar
 
 from pydantic import BaseModel
-from glom import glom
 
-from llm_patch_driver.llm.base_adapter import BaseApiAdapter
+from llm_patch_driver.llm.base_adapter import BaseApiAdapter, get_field, get_path
 from llm_patch_driver.llm.schemas import ToolCallRequest, ToolCallResponse, Message, ToolSchema
 
 U = TypeVar("U", bound=BaseModel)
 
+_CHAT_MESSAGE_PATH = ("choices", 0, "message")
+_FUNCTION_NAME_PATH = ("function", "name")
+_FUNCTION_ARGUMENTS_PATH = ("function", "arguments")
+
+
+def _parse_chat_tool_calls(tool_calls: list | None) -> List[ToolCallRequest]:
+    """Parse Chat Completions tool calls (dicts or SDK objects) into ToolCallRequest objects."""
+    return [
+        ToolCallRequest(
+            type=get_field(tool_call, "type", "function"),
+            id=get_field(tool_call, "id", ""),
+            name=get_path(tool_call, _FUNCTION_NAME_PATH, ""),
+            arguments=get_path(tool_call, _FUNCTION_ARGUMENTS_PATH, ""),
+        )
+        for tool_call in tool_calls or []
+    ]
+
+
+def _format_chat_tool_calls(tool_calls: List[ToolCallRequest]) -> List[Dict[str, Any]]:
+    """Format ToolCallRequest objects as Chat Completions tool calls."""
+    return [
+        {
+            "id": tool_call.id,
+            "type": tool_call.type,
+            "function": {"name": tool_call.name, "arguments": tool_call.arguments},
+        }
+        for tool_call in tool_calls
+    ]
+
+
+def _format_chat_message(msg: Message | ToolCallResponse) -> Dict[str, Any]:
+    """Format a Message or ToolCallResponse as a Chat Completions message."""
+    if isinstance(msg, ToolCallResponse):
+        return {"role": "tool", "tool_call_id": msg.id, "content": msg.output}
+
+    msg_dict: Dict[str, Any] = {"role": msg.role}
+
+    # Attach content only if not None
+    if msg.content is not None:
+        msg_dict["content"] = msg.content
+
+    # Attach tool_calls if present on the message
+    if msg.tool_calls:
+        msg_dict["tool_calls"] = _format_chat_tool_calls(msg.tool_calls)
+
+    return msg_dict
+
+
+def _format_responses_items(msg: Message | ToolCallResponse) -> tuple[Dict[str, Any], ...]:
+    """Format a Message or ToolCallResponse as Responses API input items."""
+    if isinstance(msg, ToolCallResponse):
+        return (
+            {
+                "type": "function_call",
+                "call_id": msg.id,
+                "name": msg.request.name,
+                "arguments": msg.request.arguments
+            },
+            {
+                "type": "function_call_output",
+                "call_id": msg.id,
+                "output": msg.output
+            },
+        )
+
+    return ({"role": msg.role, "content": msg.content},)
+
+def _parse_chat_message(msg: Any) -> Message:
+    """Parse an OpenAI-formatted chat message (dict or SDK object) into a Message."""
+    return Message(
+        role=get_field(msg, "role", "user"),
+        content=get_field(msg, "content", ""),
+        tool_calls=_parse_chat_tool_calls(get_field(msg, "tool_calls", [])),
+        attached_object=get_field(msg, "parsed")
+    )
+
+
+def _parse_responses_item(msg: Any) -> Message:
+    """Parse a Responses API input/output item into a Message."""
+    msg_type = get_field(msg, "type")
+
+    # Responses API has different tool call structure
+    tool_calls = []
+    if msg_type == "function_call":
+        tool_calls.append(
+            ToolCallRequest(
+                type=msg_type,
+                id=get_field(msg, "call_id", ""),
+                name=get_field(msg, "name", ""),
+                arguments=get_field(msg, "arguments", ""),
+            )
+        )
+
+    return Message(
+        role=get_field(msg, "role", "user"),
+        content=get_field(msg, "content", ""),
+        tool_calls=tool_calls,
+        attached_object=get_field(msg, "output_parsed")
+    )
+
 class OpenAIChatCompletions(BaseApiAdapter):
     """Adapter for OpenAI Chat Completions API."""
 
@@ -24,46 +123,14 @@ class OpenAIChatCompletions(BaseApiAdapter):
         ) -> Dict[str, Any]:
         """Format inputs for OpenAI Chat Completions API."""
         
-        model_params = {}
-        
+        # Convert Message objects to OpenAI format
+        chat_messages = [_format_chat_message(msg) for msg in messages]
+
         # Handle system prompt by adding to messages list
         if system_prompt:
-            model_params["messages"] = [{"role": "system", "content": system_prompt}]
-        else:
-            model_params["messages"] = []
-            
-        # Convert Message objects to OpenAI format and add to messages
-        for msg in messages:
-            match msg:
-                case Message():
-                    msg_dict: Dict[str, Any] = {"role": msg.role}
-
-                    # Attach content only if not None
-                    if msg.content is not None:
-                        msg_dict["content"] = msg.content
-
-                    # Attach tool_calls if present on the message
-                    if msg.tool_calls:
-                        formatted_tool_calls = []
-                        for tool_call in msg.tool_calls:
-                            tc = {
-                                "id": tool_call.id,
-                                "type": tool_call.type,
-                                "function": {
-                                    "name": tool_call.name,
-                                    "arguments": tool_call.arguments,
-                                },
-                            }
-                            formatted_tool_calls.append(tc)
-                        msg_dict["tool_calls"] = formatted_tool_calls
-
-                case ToolCallResponse():
-                    msg_dict = {
-                        "role": "tool",
-                        "tool_call_id": msg.id,
-                        "content": msg.output
-                    }
-            model_params["messages"].append(msg_dict)
+            chat_messages.insert(0, {"role": "system", "content": system_prompt})
+
+        model_params: Dict[str, Any] = {"messages": chat_messages}
         
         # Add tools if provided
         if tools:
@@ -91,65 +158,24 @@ class OpenAIChatCompletions(BaseApiAdapter):
         """Parse OpenAI Chat Completions response into Message."""
         
         # Extract message from choices.0.message (robust to dicts or objects)
-        message_data = glom(raw_response, "choices.0.message", default={})
-        
-        # Extract tool calls if present
-        tool_calls = glom(message_data, "tool_calls", default=[])
+        message_data = get_path(raw_response, _CHAT_MESSAGE_PATH, {})
         
         # Parse tool calls into ToolCallRequest format
-        parsed_tool_calls = []
-        if tool_calls:
-            for tool_call in tool_calls:
-                parsed_tool_calls.append(
-                    ToolCallRequest(
-                        type=glom(tool_call, "type", default="function"),
-                        id=glom(tool_call, "id", default=""),
-                        name=glom(tool_call, "function.name", default=""),
-                        arguments=glom(tool_call, "function.arguments", default=""),
-                    )
-                )
+        parsed_tool_calls = _parse_chat_tool_calls(get_field(message_data, "tool_calls", []))
         
         # Check for structured output (parsed object)
-        structured_output = glom(raw_response, "parsed", default=None)
+        structured_output = get_field(raw_response, "parsed")
         
         return Message(
-            role=glom(message_data, "role", default="assistant"),
-            content=glom(message_data, "content", default=""),
+            role=get_field(message_data, "role", "assistant"),
+            content=get_field(message_data, "content", ""),
             tool_calls=parsed_tool_calls,
             attached_object=structured_output
         )
 
     def parse_messages(self, messages: list) -> List[Message]:
         """Parse OpenAI-formatted messages into Message objects."""
-        
-        parsed_messages = []
-        
-        for msg in messages:
-            # Extract tool calls if present
-            tool_calls = []
-            msg_tool_calls = glom(msg, "tool_calls", default=[])
-            if msg_tool_calls:
-                for tool_call in msg_tool_calls:
-                    tool_calls.append(
-                        ToolCallRequest(
-                            type=glom(tool_call, "type", default="function"),
-                            id=glom(tool_call, "id", default=""),
-                            name=glom(tool_call, "function.name", default=""),
-                            arguments=glom(tool_call, "function.arguments", default=""),
-                        )
-                    )
-            
-            # Check for structured output in the message
-            structured_output = glom(msg, "parsed", default=None)
-            
-            parsed_messages.append(Message(
-                role=glom(msg, "role", default="user"),
-                content=glom(msg, "content", default=""),
-                tool_calls=tool_calls,
-                attached_object=structured_output
-            ))
-            
-        return parsed_messages
+        return [_parse_chat_message(msg) for msg in messages]
 
 
 class OpenAIResponses(BaseApiAdapter):
@@ -171,29 +197,8 @@ class OpenAIResponses(BaseApiAdapter):
             model_params["instructions"] = system_prompt
             
         # Convert Message objects to Responses API format
-        input_messages = []
-        for msg in messages:
-
-            match msg:
-                case Message():
-                    input_messages.append({
-                        "role": msg.role,
-                        "content": msg.content
-                    })
-                case ToolCallResponse():
-                    input_messages.append({
-                        "type": "function_call",
-                        "call_id": msg.id,
-                        "name": msg.request.name,
-                        "arguments": msg.request.arguments
-                    })
-                    input_messages.append({
-                        "type": "function_call_output",
-                        "call_id": msg.id,
-                        "output": msg.output
-                    })
+        input_messages = [item for msg in messages for item in _format_responses_items(msg)]
 
-        
         model_params["input"] = input_messages
         
         # Add tools if provided
@@ -218,65 +223,36 @@ class OpenAIResponses(BaseApiAdapter):
     def parse_llm_output(self, raw_response: Any) -> Message:
         """Parse OpenAI Responses API response into Message."""
         
-        # Extract tool calls by filtering output array for function_call type
-        output_items = glom(raw_response, "output", default=[])
-        tool_calls_data = [item for item in output_items if glom(item, "type", default=None) == "function_call"]
-        
-        # Parse tool calls into ToolCallRequest format
+        # Single pass over the output array: collect function calls and keep the first message
         parsed_tool_calls = []
-        for tool_call in tool_calls_data:
-            parsed_tool_calls.append(
-                ToolCallRequest(
-                    type=glom(tool_call, "type", default="function_call"),
-                    id=glom(tool_call, "call_id", default=""),
-                    name=glom(tool_call, "name", default=""),
-                    arguments=glom(tool_call, "arguments", default=""),
+        message_data = None
+        for item in get_field(raw_response, "output", []):
+            item_type = get_field(item, "type")
+            if item_type == "function_call":
+                parsed_tool_calls.append(
+                    ToolCallRequest(
+                        type=item_type,
+                        id=get_field(item, "call_id", ""),
+                        name=get_field(item, "name", ""),
+                        arguments=get_field(item, "arguments", ""),
+                    )
                 )
-            )
-        
-        # Extract message by filtering for message type
-        message_data = {}
-        for item in output_items:
-            if glom(item, "type", default=None) == "message":
+            elif item_type == "message" and message_data is None:
                 message_data = item
-                break
+
+        if message_data is None:
+            message_data = {}
         
         # Check for structured output (parsed object)
-        structured_output = glom(raw_response, "output_parsed", default=None)
+        structured_output = get_field(raw_response, "output_parsed")
         
         return Message(
-            role=glom(message_data, "role", default="assistant"),
-            content=glom(message_data, "content", default=""),
+            role=get_field(message_data, "role", "assistant"),
+            content=get_field(message_data, "content", ""),
             tool_calls=parsed_tool_calls,
             attached_object=structured_output
         )
 
     def parse_messages(self, messages: list) -> List[Message]:
         """Parse Responses API-formatted messages into Message objects."""
-        
-        parsed_messages = []
-        
-        for msg in messages:
-            # Responses API has different tool call structure
-            tool_calls = []
-            if glom(msg, "type", default=None) == "function_call":
-                tool_calls.append(
-                    ToolCallRequest(
-                        type=glom(msg, "type", default="function_call"),
-                        id=glom(msg, "call_id", default=""),
-                        name=glom(msg, "name", default=""),
-                        arguments=glom(msg, "arguments", default=""),
-                    )
-                )
-            
-            # Check for structured output in the message
-            structured_output = glom(msg, "output_parsed", default=None)
-            
-            parsed_messages.append(Message(
-                role=glom(msg, "role", default="user"),
-                content=glom(msg, "content", default=""),
-                tool_calls=tool_calls,
-                attached_object=structured_output
-            ))
-            
-        return parsed_messages
\ No newline at end of file
+        return [_parse_responses_item(msg) for msg in messages]
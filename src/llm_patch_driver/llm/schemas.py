@@ -1,9 +1,12 @@
 """To make internal logic readable, we use a set of dataclasses for core LLM abstractions."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, TYPE_CHECKING
 
-from pydantic import BaseModel
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
 coloring_map = {
     "system": "blue",
@@ -12,28 +15,28 @@ coloring_map = {
     "tool": "magenta",
 }
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolCallRequest:
     type: str
     id: str
     name: str
     arguments: str
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallResponse:
     request: ToolCallRequest
     type: str
     id: str
     output: str
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     role: str
     content: str | list | dict | None = None
     tool_calls: List[ToolCallRequest] = field(default_factory=list)
     attached_object: BaseModel | str | dict | None = None
 
-@dataclass
+@dataclass(slots=True)
 class ToolSchema:
     name: str
     parameters: dict
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from string import Template
 from pydantic import BaseModel
 from abc import ABC, abstractmethod
 from sortedcontainers import SortedDict
@@ -9,15 +10,41 @@ from typing import List, Type, Any, Callable, ClassVar, TYPE_CHECKING
 if TYPE_CHECKING:
     from llm_patch_driver.patch_target.target import PatchTarget
 
+# Stands in for the annotated content while an annotation template is pre-rendered
+_CONTENT_SENTINEL = "\x00object_content\x00"
+
 @dataclass
 class PatchPrompts: #TODO: check that provided string templates have all required variables
     """All patch types must have syntax and usage specific templates for prompts."""
     syntax: str
-    annotation_template: str
+    annotation_template: str | Template
     annotation_placeholder: str
     modify_tool_doc: str
     reset_tool_doc: str
     request_tool_doc: str
+    _annotation_prefix: str = field(init=False, repr=False)
+    _annotation_suffix: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Plain strings keep working: "{object_content}" is the original str.format
+        # syntax, anything else is read as a string.Template.
+        if isinstance(self.annotation_template, str):
+            template = self.annotation_template
+            if "{object_content}" in template:
+                template = template.replace("$", "$$").replace("{object_content}", "$object_content")
+                template = template.replace("{{", "{").replace("}}", "}")
+            self.annotation_template = Template(template)
+
+        # Only $object_content varies, so the template is rendered once around a sentinel
+        # (which also resolves $$ escapes) and rendering is a plain splice.
+        parts = self.annotation_template.substitute(object_content=_CONTENT_SENTINEL).split(_CONTENT_SENTINEL)
+        if len(parts) != 2:
+            raise ValueError("Annotation template must contain $object_content exactly once")
+        self._annotation_prefix, self._annotation_suffix = parts
+
+    def render_annotation(self, object_content: str) -> str:
+        """Render the annotation template around the annotated content."""
+        return self._annotation_prefix + object_content + self._annotation_suffix
 
 class PatchBundle(BaseModel, ABC):
     """A bundle of patches."""
@@ -25,7 +52,7 @@ class PatchBundle(BaseModel, ABC):
 
 class BasePatch(BaseModel, ABC):
     """Base class for all patch types."""
-    prompts: PatchPrompts
+    prompts: ClassVar[PatchPrompts]
 
     @classmethod
     @abstractmethod
@@ -49,4 +76,16 @@ class BasePatch(BaseModel, ABC):
     @classmethod
     @abstractmethod
     def content_from_map(cls, original_data: Any, map: SortedDict) -> Any:
-        """Build a content from the map."""
\ No newline at end of file
+        """Build a content from the map."""
+
+    @classmethod
+    def merge_patches(cls, patch_groups: List[List[BasePatch]], patch_target: PatchTarget) -> List[BasePatch]:
+        """Merge patch groups that were generated independently against the same state.
+
+        Patch types that support merging several groups override this. Patches
+        that cannot be merged raise ``ValueError``; by default that is any two
+        non-empty groups.
+        """
+        if sum(1 for group in patch_groups if group) > 1:
+            raise ValueError(f"{cls.__name__} cannot merge patches from several requests")
+        return [patch for group in patch_groups for patch in group]
\ No newline at end of file
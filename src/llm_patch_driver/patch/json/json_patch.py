@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import cache
+from types import MappingProxyType
 from typing import Any, Dict, List, Literal, Union, Optional, Type, ClassVar
 from pydantic import BaseModel, Field, ConfigDict, StrictBool, StrictFloat, StrictInt, model_validator, ValidationInfo
 from sortedcontainers import SortedDict
@@ -25,13 +27,40 @@ json_prompts = PatchPrompts(
     request_tool_doc="",
 )
 
+class AppendOperation(jsonpatch.PatchOperation):
+    """Appends a string ``value`` to the existing string at ``path``.
+
+    Lets the LLM grow a long string by sending only the new suffix instead of
+    replacing the whole value.
+    """
+
+    def apply(self, obj):
+        value = self.operation.get("value")
+        if not isinstance(value, str):
+            raise jsonpatch.InvalidJsonPatch("'append' operation requires a string 'value'")
+
+        subobj, part = self.pointer.to_last(obj)
+        try:
+            current = subobj[part]
+        except (KeyError, IndexError, TypeError):
+            raise jsonpatch.JsonPatchConflict(f"can't append to a non-existent value at '{self.location}'")
+
+        if not isinstance(current, str):
+            raise jsonpatch.JsonPatchConflict(f"can't append to a non-string value at '{self.location}'")
+
+        subobj[part] = current + value
+        return obj
+
+class _ExtendedJsonPatch(jsonpatch.JsonPatch):
+    operations = MappingProxyType({**jsonpatch.JsonPatch.operations, "append": AppendOperation})
+
 class JsonPatch(BasePatch):
     """A JSON Patch document represents an operation to be performed on a JSON document.
 
     Note that the op and path are ALWAYS required. Value is required for ALL operations except 'remove'.
     """
 
-    op: Literal["add", "remove", "replace"] = Field(
+    op: Literal["add", "remove", "replace", "append"] = Field(
         ...,
         description="The operation to be performed.",
     )
@@ -47,7 +76,8 @@ class JsonPatch(BasePatch):
         ...,
         description=(
             "The value to be used within the operation. REQUIRED for 'add', 'replace', "
-            "and 'test' operations. Pay close attention to the json schema to ensure "
+            "'append' and 'test' operations. For 'append' it is the string to add to the "
+            "end of the existing string. Pay close attention to the json schema to ensure "
             "patched document will be valid."
         ),
     )
@@ -55,6 +85,7 @@ class JsonPatch(BasePatch):
     prompts: ClassVar[PatchPrompts] = json_prompts
 
     @classmethod
+    @cache
     def get_bundle_schema(cls) -> Type[PatchBundle]:
         class JsonPatchBundle(PatchBundle):
             patches: List[JsonPatch]
@@ -63,6 +94,63 @@ class JsonPatch(BasePatch):
 
         return JsonPatchBundle
 
+    def _target_path(self, lookup_map: SortedDict) -> tuple[str, ...]:
+        """JSON pointer segments of the value this patch touches."""
+        path = tuple(lookup_map[self.a_id].split("/")[1:])
+        return path if self.i_id is None else (*path, str(self.i_id - 1))
+
+    @classmethod
+    def merge_patches(cls, patch_groups: List[List[JsonPatch]], patch_target: 'PatchTarget') -> List[JsonPatch]:
+        """Merge patch groups that were generated against the same document.
+
+        Groups may not touch the same value or one another's ancestors. All
+        array indices refer to the original document, so item operations on the
+        same array are applied from the highest index down to keep the lower
+        indices valid. Adding or removing an item shifts everything after it, so
+        no other group may reach into that array below its own items.
+        """
+        merged = [patch for group in patch_groups for patch in group]
+        if sum(1 for group in patch_groups if group) < 2:
+            return merged
+
+        lookup_map = patch_target._lookup_map
+        claimed: List[tuple[tuple[str, ...], int]] = []
+        # arrays whose item indices are shifted by an add or remove
+        shifted: List[tuple[tuple[str, ...], int]] = []
+        for group_idx, group in enumerate(patch_groups):
+            paths = [patch._target_path(lookup_map) for patch in group]
+            for path in paths:
+                for other, other_idx in claimed:
+                    if other_idx != group_idx and (path[:len(other)] == other or other[:len(path)] == path):
+                        raise ValueError(f"Patches from different requests overlap at '/{'/'.join(path)}'")
+            claimed.extend((path, group_idx) for path in paths)
+            shifted.extend(
+                (path[:-1], group_idx)
+                for patch, path in zip(group, paths)
+                if patch.op in ("add", "remove") and patch.i_id is not None
+            )
+
+        for (path, group_idx), patch in zip(claimed, merged):
+            for array, array_idx in shifted:
+                nested = len(path) > len(array) + 1 or patch.i_id is None
+                if array_idx != group_idx and nested and path[:len(array)] == array:
+                    raise ValueError(
+                        f"Patches from different requests overlap at '/{'/'.join(path)}': "
+                        f"another request adds or removes items of '/{'/'.join(array)}'"
+                    )
+
+        # reorder item operations per array in place, leaving every other patch where it is
+        slots: Dict[int, List[int]] = {}
+        for pos, patch in enumerate(merged):
+            if patch.i_id is not None:
+                slots.setdefault(patch.a_id, []).append(pos)
+        for positions in slots.values():
+            ordered = sorted((merged[pos] for pos in positions), key=lambda p: p.i_id, reverse=True)
+            for pos, patch in zip(positions, ordered):
+                merged[pos] = patch
+
+        return merged
+
     def apply_patch(self, patch_target: 'PatchTarget') -> None:
         path = patch_target._lookup_map[self.a_id]
 
@@ -78,8 +166,11 @@ class JsonPatch(BasePatch):
 
             case "remove":
                 op_dict = {"op": "remove", "path": path}
+
+            case "append":
+                op_dict = {"op": "append", "path": path, "value": self.value}
             
-        patch_obj = jsonpatch.JsonPatch([op_dict])
+        patch_obj = _ExtendedJsonPatch([op_dict])
         patch_obj.apply(patch_target.content, in_place=True)
 
     @classmethod
@@ -211,6 +302,15 @@ class JsonPatch(BasePatch):
         
     #     return self
     
+    @model_validator(mode="after")
+    def _check_append_value(self):
+        """Reject non-string appends here so the LLM gets them back as a validation error."""
+
+        if self.op == "append" and not isinstance(self.value, str):
+            raise ValueError("'append' operation requires a string 'value'")
+
+        return self
+
     @model_validator(mode="after")
     def _check_ids(self, info: ValidationInfo):
 
@@ -1,11 +1,14 @@
-JSON_ANNOTATION_TEMPLATE = """
+from string import Template
+from textwrap import dedent
+
+JSON_ANNOTATION_TEMPLATE = Template(dedent("""
 <annotation_syntax>
 The JSON was annotated with <a> and <i> tags. That was made to help you navigate the JSON data.
 The <a> tag means 'anchor' and the <i> tag means 'index'. They are temporary tags that are visible only to you.
 <a> tags are added to all keys in the JSON. The <i> tag is added to all elements in all arrays.
 
     Example: 
-    - {{"sample_key": 1}} -> {{<a=1 k=sample_key>: 1}}
+    - {"sample_key": 1} -> {<a=1 k=sample_key>: 1}
     - [A, B, C] -> [<i=1 v=A>, <i=2 v=B>, <i=3 v=C>]
 
 The real JSON does not have any annotations. They are visible only to you.
@@ -15,7 +18,7 @@ This version of the JSON is the current state of the object.
 
 <annotated_json>
 ```json
-{object_content}
+$object_content
 ```
 </annotated_json>
 
@@ -25,16 +28,16 @@ The <a> tag means 'anchor' and the <i> tag means 'index'. They are temporary tag
 <a> tags are added to all keys in the JSON. The <i> tag is added to all elements in all arrays.
 
     Example: 
-    - {{"sample_key": 1}} -> {{<a=1 k=sample_key>: 1}}
+    - {"sample_key": 1} -> {<a=1 k=sample_key>: 1}
     - [A, B, C] -> [<i=1 v=A>, <i=2 v=B>, <i=3 v=C>]
 
 The real JSON does not have any annotations. They are visible only to you.
 
 This version of the JSON is the current state of the object.
 </annotation_syntax>
-"""
+""").strip())
 
-JSON_PATCH_SYNTAX = """
+JSON_PATCH_SYNTAX = dedent("""
 <patch description="A patch is a JSON object that will be parsed and used to modify the JSON document.">
     <overview>
         You do NOT provide JSON Pointer paths directly. Instead, you use:
@@ -45,21 +48,23 @@ JSON_PATCH_SYNTAX = """
         - op = "replace": Replace the entire value stored at the key identified by <a_id>. Do NOT use <i_id> here.
         - op = "add": Add a value either at the key identified by <a_id> or into the array at that key using <i_id>.
         - op = "remove": Remove a key (no <i_id>) or remove an array item (with <i_id>).
+        - op = "append": Add text to the end of an existing string value, at the key identified by <a_id> or at the array item <i_id>.
 
         Requirements:
         - "op" and "a_id" are always required.
-        - "value" is required for "add" and "replace"; for "remove" it MUST be null.
+        - "value" is required for "add" and "replace"; for "remove" it MUST be null; for "append" it MUST be a string.
         - For arrays, <i_id> is 1-based. Internally it is converted to 0-based (i_id - 1).
     </overview>
 
     <fields>
         <field name="op">
             <description>The operation to perform.</description>
-            <data_type>Literal["add", "remove", "replace"]</data_type>
+            <data_type>Literal["add", "remove", "replace", "append"]</data_type>
             <notes>
                 - Use "replace" to overwrite the value of a key. Do not include <i_id>.
                 - Use "add" to insert into arrays (with <i_id>) or to set a value at a key.
                 - Use "remove" to delete a key or an array element. For remove, set "value" to null.
+                - Use "append" to extend a long string. Send only the new text instead of replacing the whole string.
             </notes>
         </field>
 
@@ -67,12 +72,12 @@ JSON_PATCH_SYNTAX = """
             <description>The anchor id of the key to operate on. This id comes from the <a=ID k=...> tags in the annotated JSON.</description>
             <data_type>int</data_type>
             <example>
-                If the annotation shows {{"<a=12 k=roles>": [ ... ]}}, then a_id=12 refers to the "roles" key.
+                If the annotation shows {"<a=12 k=roles>": [ ... ]}, then a_id=12 refers to the "roles" key.
             </example>
         </field>
 
         <field name="i_id" optional="true">
-            <description>Item index inside the array at <a_id>. Only for array operations ("add" and "remove"). 1-based.</description>
+            <description>Item index inside the array at <a_id>. Only for array operations ("add", "remove" and "append"). 1-based.</description>
             <data_type>int | null</data_type>
             <notes>
                 - Omit or set to null for key-level operations or when op is "replace".
@@ -87,6 +92,7 @@ JSON_PATCH_SYNTAX = """
             <rules>
                 - Required and non-null for "add" and "replace".
                 - Must be null for "remove".
+                - Must be a string for "append".
             </rules>
         </field>
     </fields>
@@ -97,19 +103,31 @@ JSON_PATCH_SYNTAX = """
                 You see a key annotated as <a=2 k=name> and want to change its value from "Alice" to "Alicia".
             </when>
             <patch_example>
-                {{"op": "replace", "a_id": 2, "i_id": null, "value": "Alicia"}}
+                {"op": "replace", "a_id": 2, "i_id": null, "value": "Alicia"}
             </patch_example>
             <notes>
                 - Do not include i_id (omit or set to null) for replace.
             </notes>
         </case>
 
+        <case name="Extend a long string value">
+            <when>
+                You see a key annotated as <a=4 k=summary> whose value is "The project started in May." and want to add a sentence.
+            </when>
+            <patch_example>
+                {"op": "append", "a_id": 4, "i_id": null, "value": " It shipped in June."}
+            </patch_example>
+            <notes>
+                - The value is added to the end as is, so include any leading space yourself.
+            </notes>
+        </case>
+
         <case name="Insert a new item into an array">
             <when>
                 You see an array annotated under <a=3 k=roles>: [<i=1 v=admin>, <i=2 v=editor>]. Insert "viewer" as the 3rd item.
             </when>
             <patch_example>
-                {{"op": "add", "a_id": 3, "i_id": 3, "value": "viewer"}}
+                {"op": "add", "a_id": 3, "i_id": 3, "value": "viewer"}
             </patch_example>
             <notes>
                 - i_id is 1-based; i_id=3 inserts at internal index 2.
@@ -122,7 +140,7 @@ JSON_PATCH_SYNTAX = """
                 You see a key annotated as <a=2 k=name> and want to delete it entirely.
             </when>
             <patch_example>
-                {{"op": "remove", "a_id": 2, "i_id": null, "value": null}}
+                {"op": "remove", "a_id": 2, "i_id": null, "value": null}
             </patch_example>
             <notes>
                 - Removing a key deletes it from the object.
@@ -134,7 +152,7 @@ JSON_PATCH_SYNTAX = """
                 You see an array under <a=3 k=roles> and want to remove the first item.
             </when>
             <patch_example>
-                {{"op": "remove", "a_id": 3, "i_id": 1, "value": null}}
+                {"op": "remove", "a_id": 3, "i_id": 1, "value": null}
             </patch_example>
             <notes>
                 - i_id=1 targets the first element.
@@ -143,21 +161,21 @@ JSON_PATCH_SYNTAX = """
 
         <case name="Add a complex object as an array item">
             <when>
-                You see <a=10 k=items>: [] and you want to insert {{"id": 1, "qty": 2}} as the first element.
+                You see <a=10 k=items>: [] and you want to insert {"id": 1, "qty": 2} as the first element.
             </when>
             <patch_example>
-                {{"op": "add", "a_id": 10, "i_id": 1, "value": {{"id": 1, "qty": 2}}}}
+                {"op": "add", "a_id": 10, "i_id": 1, "value": {"id": 1, "qty": 2}}
             </patch_example>
         </case>
     </how_to_build>
 </patch>
-"""
+""").strip()
 
-ANNOTATION_PLACEHOLDER = """
+ANNOTATION_PLACEHOLDER = dedent("""
 <current_state_of_the_text>
-    <annotated_text>
-        THIS VERSION OF THE JSON IS NO LONGER ACTUAL. IT WAS REMOVED FROM THE MESSAGE HISTORY TO SAVE SPACE.
-        BELOW IN THE CONVERSATION YOU WILL SEE THE CURRENT STATE OF THE OBJECT. IGNORE THIS ONE.
-    </annotated_text>
+<annotated_text>
+THIS VERSION OF THE JSON IS NO LONGER ACTUAL. IT WAS REMOVED FROM THE MESSAGE HISTORY TO SAVE SPACE.
+BELOW IN THE CONVERSATION YOU WILL SEE THE CURRENT STATE OF THE OBJECT. IGNORE THIS ONE.
+</annotated_text>
 </current_state_of_the_text>
-"""
\ No newline at end of file
+""").strip()
\ No newline at end of file
@@ -1,24 +1,27 @@
-STR_ANNOTATION_TEMPLATE = """
+from string import Template
+from textwrap import dedent
+
+STR_ANNOTATION_TEMPLATE = Template(dedent("""
 <current_state_of_the_text>
-    The text was annotated with <tid> tags. Each tid is a unique identifier for a sentence in the text.
-    That was made to help you modify the text. To modify the text, just provide a list of tids and the required modification.
-    The final text will not have any annotations. This is just a temporary view to help you modify the text.
+The text was annotated with <tid> tags. Each tid is a unique identifier for a sentence in the text.
+That was made to help you modify the text. To modify the text, just provide a list of tids and the required modification.
+The final text will not have any annotations. This is just a temporary view to help you modify the text.
 
-    This version of the text is the current state of the object.
+This version of the text is the current state of the object.
 
-        <annotated_text>
-            {object_content}
-        </annotated_text>
+<annotated_text>
+$object_content
+</annotated_text>
 
-    This version of the text is the current state of the object.
+This version of the text is the current state of the object.
 
-    The text was annotated with <tid> tags. Each tid is a unique identifier for a sentence in the text.
-    That was made to help you modify the text. To modify the text, just provide a list of tids and the required modification.
-    The final text will not have any annotations. This is just a temporary view to help you modify the text.
+The text was annotated with <tid> tags. Each tid is a unique identifier for a sentence in the text.
+That was made to help you modify the text. To modify the text, just provide a list of tids and the required modification.
+The final text will not have any annotations. This is just a temporary view to help you modify the text.
 </current_state_of_the_text>
-    """
+""").strip())
 
-STR_PATCH_SYNTAX = """
+STR_PATCH_SYNTAX = dedent("""
     <patch description="A patch is a JSON object that will be parsed and then used to modify the text.">
         <fields>
             <field name="tids">
@@ -45,7 +48,7 @@ STR_PATCH_SYNTAX = """
                             <data_type>Literal["replace"]</data_type>
                         </field>
                         <field name="pattern">
-                            <description>The pattern to replace. Will be parsed as a regex.</description>
+                            <description>The exact text to replace. Matched literally, not as a regex.</description>
                             <data_type>str</data_type>
                         </field>
                         <field name="replacement">
@@ -77,13 +80,13 @@ STR_PATCH_SYNTAX = """
             </field>
         </fields>
     </patch>
-    """
+    """).strip()
 
-ANNOTATION_PLACEHOLDER = """
+ANNOTATION_PLACEHOLDER = dedent("""
 <current_state_of_the_text>
-    <annotated_text>
-        THIS VERSION OF THE TEXT IS NO LONGER ACTUAL. IT WAS REMOVED FROM THE MESSAGE HISTORY TO SAVE SPACE.
-        BELOW IN THE CONVERSATION YOU WILL SEE THE CURRENT STATE OF THE OBJECT. IGNORE THIS ONE.
-    </annotated_text>
+<annotated_text>
+THIS VERSION OF THE TEXT IS NO LONGER ACTUAL. IT WAS REMOVED FROM THE MESSAGE HISTORY TO SAVE SPACE.
+BELOW IN THE CONVERSATION YOU WILL SEE THE CURRENT STATE OF THE OBJECT. IGNORE THIS ONE.
+</annotated_text>
 </current_state_of_the_text>
-"""
+""").strip()
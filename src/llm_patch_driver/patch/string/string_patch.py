@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, model_validator, PrivateAttr, ValidationInfo
+import re
+from collections import OrderedDict
+from functools import cache
+from operator import attrgetter
+from weakref import WeakKeyDictionary
+from pydantic import BaseModel, ConfigDict, Field, model_validator, PrivateAttr, ValidationInfo
 from typing import List, Literal, Type, ClassVar, Any
 from sortedcontainers import SortedDict
 from ..base_patch import BasePatch, PatchPrompts, PatchBundle
@@ -19,9 +24,41 @@ string_prompts = PatchPrompts(
     request_tool_doc="",
 )
 
+# "<line>_<sentence>" identifier, e.g. "2_1"
+_TID_RE = re.compile(r"(\d+)_(\d+)")
+
+# Order of deletes and inserts that anchor to the same line: inserting first keeps
+# the anchor in place even when the delete empties that line
+_OP_PRIORITY = {
+    "insert_after": 0,
+    "delete": 1,
+}
+
+def _bundle_order(operation_type: str, parsed_tids: List[tuple[int, int]]) -> tuple[int, int, int]:
+    """Bundle order: replacements first, then deletes and inserts from the bottom of the text up.
+
+    Replacements never renumber tids. Deletes and inserts only renumber the lines
+    below them, so applying them bottom-up keeps every tid pointing at the original text.
+    """
+    if operation_type == "replace":
+        return (0, 0, 0)
+    # Inserts anchor to the last tid's line; deletes anchor to the highest referenced line
+    if not parsed_tids:
+        anchor_line = 0
+    elif operation_type == "insert_after":
+        anchor_line = parsed_tids[-1][0]
+    else:
+        anchor_line = max(line for line, _ in parsed_tids)
+    return (1, -anchor_line, _OP_PRIORITY.get(operation_type, 99))
+
+# en_core_web_sm components not needed for sentence segmentation
+_UNUSED_PIPES = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+
 class ReplaceOp(BaseModel):
     """Pattern substitution operation (no tids here)."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["replace"] = "replace"
     pattern: str
     replacement: str
@@ -29,11 +66,15 @@ class ReplaceOp(BaseModel):
 class DeleteOp(BaseModel):
     """Deletion operation - remove the supplied tids."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["delete"] = "delete"
 
 class InsertAfterOp(BaseModel):
     """Insert a new line after the line of *last tid*."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["insert_after"] = "insert_after"
     text: str
 
@@ -47,28 +88,47 @@ class StrPatch(BasePatch):
 
     # Internal cache of parsed tids for fast access during apply phase
     _parsed_tids: List[tuple[int, int]] = PrivateAttr()
+    _sort_key: tuple[int, int, int] = PrivateAttr()
 
     # Module-level cache for spaCy pipeline, scoped to this class
     _NLP: ClassVar[Any] = None
 
+    # Set before the first patch is built to segment with `en_core_web_sm`
+    use_statistical_model: ClassVar[bool] = False
+
+    # LRU caches of per-line sentence splits, one per spaCy pipeline (shared with
+    # subclasses). Patches touch few lines, so rebuilding the map after a patch only
+    # runs spaCy on the lines that changed.
+    _SENT_CACHE: ClassVar[WeakKeyDictionary[Any, OrderedDict[str, tuple[str, ...]]]] = WeakKeyDictionary()
+    _SENT_CACHE_SIZE: ClassVar[int] = 4096
+
     @classmethod
     def _get_nlp(cls):
         """Return a cached spaCy pipeline, importing spaCy lazily.
 
-        Loads `en_core_web_sm` if available, otherwise uses a blank English pipeline
-        with the sentencizer. This avoids importing spaCy at module import time.
+        Uses a blank English pipeline with the rule-based sentencizer. When
+        `use_statistical_model` is set, loads `en_core_web_sm` instead (falling
+        back to the sentencizer if it is not installed). Only sentence boundaries
+        are needed, so the statistical model is loaded without its tagging,
+        parsing and NER components and segments with `senter`.
+        This avoids importing spaCy at module import time.
         """
         if cls._NLP is not None:
             return cls._NLP
         import spacy as _spacy
-        try:
-            cls._NLP = _spacy.load("en_core_web_sm")
-        except OSError:
-            cls._NLP = _spacy.blank("en")
-            cls._NLP.add_pipe("sentencizer")
+        if cls.use_statistical_model:
+            try:
+                cls._NLP = _spacy.load("en_core_web_sm", exclude=_UNUSED_PIPES)
+                cls._NLP.enable_pipe("senter")
+                return cls._NLP
+            except OSError:
+                pass
+        cls._NLP = _spacy.blank("en")
+        cls._NLP.add_pipe("sentencizer")
         return cls._NLP
 
     @classmethod
+    @cache
     def get_bundle_schema(cls) -> Type[PatchBundle]:
        
         class StrPatchBundle(PatchBundle):
@@ -77,30 +137,45 @@ class StrPatch(BasePatch):
             __doc__ = f"Patch bundle. Syntax: {cls.prompts.syntax}"
 
             def model_post_init(self, __context):
-                """Sort patches to keep coordinate validity: replacements first, then deletes, then inserts."""
-                
-                priority = {
-                    "replace": 0,
-                    "delete": 1,
-                    "insert_after": 2,
-                }
-
-                def _anchor_line(patch: StrPatch) -> int:
-                    # Inserts anchor to the last tid's line; deletes/replaces anchor to the highest referenced line
-                    if patch.operation.type == "insert_after":
-                        anchor_tid = patch.tids[-1]
-                        return int(anchor_tid.split("_")[0])
-                    return max(int(t.split("_")[0]) for t in patch.tids)
-
-                # Sort patches to keep coordinate validity: replacements first, then deletes, then inserts.
-                sorted_patches = sorted(
-                    self.patches,
-                    key=lambda p: (priority.get(p.operation.type, 99), -_anchor_line(p)),
-                )
-                self.patches = sorted_patches
+                """Order patches so that every tid still refers to the original text when applied."""
+
+                # Split deletes per line: each line drops its sentences in one rebuild using
+                # the original numbering, and can then be ordered against the inserts.
+                ordered = [p for p in self.patches if p.operation.type != "delete"]
+                deletes = [p for p in self.patches if p.operation.type == "delete"]
+                deleted: dict[int, dict[tuple[int, int], None]] = {}
+                for patch in deletes:
+                    for tid in patch._parsed_tids:
+                        deleted.setdefault(tid[0], {})[tid] = None
+
+                for tids in deleted.values():
+                    # copy a parsed delete instead of constructing one, so its tids aren't parsed again
+                    line_delete = deletes[0].model_copy(update={"tids": [f"{line}_{sent}" for line, sent in tids]})
+                    line_delete._parsed_tids = list(tids)
+                    line_delete._sort_key = _bundle_order("delete", line_delete._parsed_tids)
+                    ordered.append(line_delete)
+
+                self.patches = sorted(ordered, key=attrgetter("_sort_key"))
 
         return StrPatchBundle
 
+    @classmethod
+    def merge_patches(cls, patch_groups: List[List[StrPatch]], patch_target: 'PatchTarget') -> List[StrPatch]:
+        """Merge patch groups, rejecting tids targeted by more than one group.
+
+        The bundle applies replacements first and then deletes and inserts from the
+        bottom of the text up, so every tid keeps referring to the original text and
+        groups only have to touch different sentences.
+        """
+        owners: dict[tuple[int, int], int] = {}
+        for group_idx, group in enumerate(patch_groups):
+            for patch in group:
+                for line, sent in patch._parsed_tids:
+                    if owners.setdefault((line, sent), group_idx) != group_idx:
+                        raise ValueError(f"Patches from different requests overlap at tid '{line}_{sent}'")
+
+        return [patch for group in patch_groups for patch in group]
+
     def apply_patch(self, patch_target: 'PatchTarget') -> None:
         match self.operation:
             # -- replace -------------------------------------------------- #
@@ -111,25 +186,35 @@ class StrPatch(BasePatch):
 
             # -- delete --------------------------------------------------- #
             case DeleteOp():
-                for line, sent in sorted(self._parsed_tids, key=lambda x: (x[0], x[1]), reverse=True):
-                    line_map = patch_target._lookup_map[line]
-                    del line_map[sent]
-                    for sid in sorted([k for k in line_map if k > sent]):
-                        line_map[sid - 1] = line_map.pop(sid)
-
-                    if not line_map:
-                        del patch_target._lookup_map[line]
-                        for idx in range(line + 1, max(patch_target._lookup_map.keys(), default=line) + 1):
-                            if idx in patch_target._lookup_map:
-                                patch_target._lookup_map[idx - 1] = patch_target._lookup_map.pop(idx)
+                lookup_map = patch_target._lookup_map
+                deleted: dict[int, set[int]] = {}
+                for line, sent in self._parsed_tids:
+                    deleted.setdefault(line, set()).add(sent)
+
+                # renumber each touched line once instead of shifting ids one by one
+                emptied_lines = set()
+                for line, sents in deleted.items():
+                    line_map = lookup_map[line]
+                    kept = [s for sid, s in line_map.items() if sid not in sents]
+                    if not kept:
+                        emptied_lines.add(line)
+                        continue
+                    line_map.clear()
+                    line_map.update(enumerate(kept, start=1))
+
+                if emptied_lines:
+                    kept_lines = [m for line, m in lookup_map.items() if line not in emptied_lines]
+                    lookup_map.clear()
+                    lookup_map.update(enumerate(kept_lines, start=1))
 
             # -- insert after ------------------------------------------- #
             case InsertAfterOp(text=text):
                 anchor_line, _ = self._parsed_tids[-1]
 
-                max_line = max(patch_target._lookup_map) if patch_target._lookup_map else 0
-                for idx in range(max_line, anchor_line, -1):
-                    patch_target._lookup_map[idx + 1] = patch_target._lookup_map[idx]
+                # shift only the lines after the anchor, re-keyed in one update
+                lookup_map = patch_target._lookup_map
+                trailing = list(lookup_map.irange(minimum=anchor_line + 1))
+                lookup_map.update([(idx + 1, lookup_map.pop(idx)) for idx in trailing])
 
                 new_line_id = anchor_line + 1
                 nlp = self._get_nlp()
@@ -147,9 +232,19 @@ class StrPatch(BasePatch):
         sent_map: SortedDict = SortedDict()
         lines = text.splitlines()
         nlp = cls._get_nlp()
-        for line_idx, doc in enumerate(nlp.pipe(lines), start=1):
-            line_sents: List[str] = [s.text_with_ws for s in doc.sents] or [lines[line_idx - 1]]
-            sent_map[line_idx] = SortedDict({sid: s for sid, s in enumerate(line_sents, start=1)})
+        cache = cls._SENT_CACHE.setdefault(nlp, OrderedDict())
+
+        missing = list(dict.fromkeys(line for line in lines if line not in cache))
+        if missing:
+            for line, doc in zip(missing, nlp.pipe(missing)):
+                cache[line] = tuple(s.text_with_ws for s in doc.sents) or (line,)
+
+        for line_idx, line in enumerate(lines, start=1):
+            cache.move_to_end(line)
+            sent_map[line_idx] = SortedDict(enumerate(cache[line], start=1))
+
+        while len(cache) > cls._SENT_CACHE_SIZE:
+            cache.popitem(last=False)
 
         return sent_map
     
@@ -159,13 +254,11 @@ class StrPatch(BasePatch):
 
         Used for LLM prompts to help LLMs modify the text.
         """
-        annotated_parts: List[str] = []
-        for line_id, line_map in map.items(): 
-            for sent_id, sent in line_map.items():
-                display_sentence = sent.rstrip()
-                annotated_parts.append(f"<tid={line_id}_{sent_id}>{display_sentence}</tid>")
-
-        return "\n".join(annotated_parts)
+        return "\n".join(
+            f"<tid={line_id}_{sent_id}>{sent.rstrip()}</tid>"
+            for line_id, line_map in map.items()
+            for sent_id, sent in line_map.items()
+        )
     
     @classmethod
     def content_from_map(cls, original_data: str, map: SortedDict) -> str:
@@ -174,40 +267,33 @@ class StrPatch(BasePatch):
         This is the inverse operation of build_map.
         """
 
-        lines: List[str] = []
-        for line_id, line_map in map.items():  
-            sents = [line_map[sid] for sid in line_map]      
-            lines.append("".join(sents))
-            
-        return "\n".join(lines)
-
-    @model_validator(mode="after")
-    def _parse_tids(cls, v):  # type: ignore[cls-parameter-name]
-        parsed: List[tuple[int, int]] = []
+        return "\n".join("".join(line_map.values()) for line_map in map.values())
 
-        if not v.tids:
+    def model_post_init(self, __context):
+        # Tids are parsed here rather than in an after-validator because model_construct()
+        # runs this too; errors raised here surface as a ValidationError when validating.
+        if not self.tids:
             raise ValueError("Patch must contain at least one tid")
-        
-        for tid in v.tids:
-            try:
-                l_str, s_str = tid.split("_")
-                parsed.append((int(l_str), int(s_str)))
 
-            except Exception:
+        parsed: List[tuple[int, int]] = []
+        for tid in self.tids:
+            match = _TID_RE.fullmatch(tid)
+            if match is None:
                 raise ValueError(f"Invalid tid format '{tid}'. Expected '<line>_<sentence>'.")
+            parsed.append((int(match[1]), int(match[2])))
 
-        v._parsed_tids = parsed
+        self._parsed_tids = parsed
+        self._sort_key = _bundle_order(self.operation.type, parsed)
 
-        return v
-    
     @model_validator(mode="after")
     def _check_ids(self, info: ValidationInfo):
         if isinstance(info.context, dict):
             id_map: dict = info.context.get("id_content_map", {})
             for line, sent in self._parsed_tids:
-                if line not in id_map:
+                line_map = id_map.get(line)
+                if line_map is None:
                     raise ValueError(f"Line {line} does not exist")
-                if sent not in id_map[line]:
+                if sent not in line_map:
                     raise ValueError(f"Sentence {sent} does not exist in line {line}")
 
         return self
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Generic, Type, Callable, Optional, Coroutine, Any, TypeVar, List, Dict, cast
+from typing import Generic, Type, Callable, Optional, Coroutine, Any, TypeVar, List, cast
 from pydantic import BaseModel, model_validator, ValidationError, PrivateAttr
 from sortedcontainers import SortedDict
 from copy import deepcopy
+from functools import cache
+from string import Template
 import inspect
 
 from .prompts import ERROR_TEMPLATE
@@ -12,6 +14,17 @@ from llm_patch_driver.patch.base_patch import BasePatch
 
 T = TypeVar("T")
 
+@cache
+def _elided_error_template(annotation_placeholder: str) -> Template:
+    """ERROR_TEMPLATE with the annotated state already replaced by the placeholder."""
+    return Template(
+        ERROR_TEMPLATE.safe_substitute(annotated_state=annotation_placeholder.replace("$", "$$"))
+    )
+
+def _snapshot(value: T) -> T:
+    """Independent copy of the content. Strings are immutable, so they are shared as is."""
+    return value if isinstance(value, str) else deepcopy(value)
+
 class PatchTarget(BaseModel, Generic[T]):
     """Wrapper for a target object that needs to be patched.
 
@@ -53,11 +66,14 @@ class PatchTarget(BaseModel, Generic[T]):
 
     _backup_copy: T | None = PrivateAttr(default=None)
     _annotated: str = PrivateAttr(default="")
-    _lookup_map: SortedDict = PrivateAttr(default=SortedDict())
+    _lookup_map: SortedDict = PrivateAttr(default_factory=SortedDict)
     _iteration: int = PrivateAttr(default=0)
+    _annotated_content_cache: tuple = PrivateAttr(default=(None, ""))
+    _debugging_state_cache: tuple = PrivateAttr(default=((), ""))
+    _condition_is_async: tuple = PrivateAttr(default=(None, False))
 
     def model_post_init(self, __context):
-        self._backup_copy = deepcopy(self.content)
+        self._backup_copy = _snapshot(self.content)
         self._lookup_map = self.patch_type.build_map(self.content)
         self._annotated = self.patch_type.build_annotation(self.content, self._lookup_map)
 
@@ -77,17 +93,27 @@ class PatchTarget(BaseModel, Generic[T]):
 
     @property
     def annotated_content(self) -> str:
-        return self.patch_type.prompts.annotation_template.format(
-            object_content=str(self._annotated)
-        )
+        # _annotated is only replaced by apply_patches and reset_to_original_state
+        annotated, rendered = self._annotated_content_cache
+        if annotated is not self._annotated:
+            rendered = self.patch_type.prompts.render_annotation(self._annotated)
+            self._annotated_content_cache = (self._annotated, rendered)
+        return rendered
 
     @property
     def debugging_message(self) -> Message:
-        debugging_state = ERROR_TEMPLATE.format(
-            state_id=self._iteration,
-            error_message=self.current_error,
-            annotated_state=self.annotated_content
-        )
+        # the rendered state embeds the whole annotated object, so it is only
+        # rebuilt when the state or the error changes
+        cache_key = (self._iteration, self.current_error, self._annotated)
+        cached_key, debugging_state = self._debugging_state_cache
+
+        if cached_key != cache_key:
+            debugging_state = ERROR_TEMPLATE.substitute(
+                state_id=self._iteration,
+                error_message=self.current_error,
+                annotated_state=self.annotated_content
+            )
+            self._debugging_state_cache = (cache_key, debugging_state)
 
         return Message(
             role="system",
@@ -96,10 +122,10 @@ class PatchTarget(BaseModel, Generic[T]):
     
     @property
     def debugging_message_placeholder(self) -> Message:
-        debugging_state = ERROR_TEMPLATE.format(
+        elided_template = _elided_error_template(self.patch_type.prompts.annotation_placeholder)
+        debugging_state = elided_template.substitute(
             state_id=self._iteration,
-            error_message=self.current_error,
-            annotated_state=self.patch_type.prompts.annotation_placeholder
+            error_message=self.current_error
         )
 
         return Message(
@@ -108,7 +134,7 @@ class PatchTarget(BaseModel, Generic[T]):
         )
     
     async def reset_to_original_state(self) -> None:
-        self.content = deepcopy(self._backup_copy)
+        self.content = _snapshot(self._backup_copy)
         self._iteration = 0
         self._lookup_map = self.patch_type.build_map(self.content)
         self._annotated = self.patch_type.build_annotation(self.content, self._lookup_map)
@@ -134,7 +160,13 @@ class PatchTarget(BaseModel, Generic[T]):
                 return str(e)
 
         if function := self.validation_condition:
-            if inspect.iscoroutinefunction(function):
+            # validation_condition can be reassigned, so the check is cached per function
+            checked, is_async = self._condition_is_async
+            if checked is not function:
+                is_async = inspect.iscoroutinefunction(function)
+                self._condition_is_async = (function, is_async)
+
+            if is_async:
                 return await function(self.content)
             else:
                 return cast(Optional[str], function(self.content))
@@ -0,0 +1,58 @@
+"""Shared setup for the end-to-end scenarios."""
+
+import os
+
+from llm_patch_driver import PatchDriver
+from llm_patch_driver.llm.google_adapters import GoogleGenAiAdapter
+
+
+def setup_client():
+    """Load the environment and return a Vertex AI Gemini client.
+
+    Phoenix tracing is registered only when ``PHOENIX_ENABLED=1``; otherwise the
+    LLM calls run without instrumentation. SDK and tracing imports stay out of
+    module import, so collecting the scenarios is cheap.
+    """
+    from dotenv import load_dotenv
+    from google import genai
+
+    load_dotenv()
+
+    client = genai.Client(
+        vertexai=True, project=os.getenv("GCP_PROJECT_ID"), location=os.getenv("GCP_LOCATION")
+    )
+
+    if os.getenv("PHOENIX_ENABLED") == "1":
+        from phoenix.otel import register
+
+        register(
+            project_name="llm-patch-driver",
+            endpoint=os.getenv("OTEL_ENDPOINT"),
+            batch=True,
+            auto_instrument=True
+        )
+
+    return client
+
+
+async def run_scenario(target, messages, client):
+    """Validate ``target`` and run the patching loop with Gemini until it is fixed."""
+    error = await target.validate_content()
+
+    if error:
+        target.current_error = error  # needed so the loop starts
+        create_method = client.aio.models.generate_content
+        parse_method = client.aio.models.generate_content
+        driver = PatchDriver(
+            target, 
+            create_method, 
+            parse_method, 
+            {'model': 'gemini-2.5-pro'}, 
+            GoogleGenAiAdapter()
+            )
+        await driver.run_patching_loop(messages)
+        print("===== ORIGINAL STATE =====")
+        print(target.content)
+        print("===== PATCHED STATE =====")
+        print(target.content)
+        print("=========================")
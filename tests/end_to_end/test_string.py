@@ -13,63 +13,20 @@ the rules.
 """
 
 import asyncio
-import os
 
 from functools import partial
 
-from dotenv import load_dotenv
-from phoenix.otel import register
-from google import genai
-
-from llm_patch_driver import PatchDriver, PatchTarget, StrPatch
-from llm_patch_driver.llm.google_adapters import GoogleGenAiAdapter
+from llm_patch_driver import PatchTarget, StrPatch
+from .common import run_scenario, setup_client
 from .test_string_assets import messages, validation_string_condition, DOC
 
-load_dotenv()
-
-location = os.getenv("GCP_LOCATION")
-project_id = os.getenv("GCP_PROJECT_ID")
-endpoint = os.getenv("OTEL_ENDPOINT")
-
-client = genai.Client(
-    vertexai=True, project=project_id, location=location
-)
-
-phoenix_provider = register(
-    project_name="llm-patch-driver",
-    endpoint=endpoint,
-    batch=True,
-    auto_instrument=True
-)
-
-target_object = PatchTarget(
-    object=DOC,
-    validation_condition=partial(validation_string_condition, call_llm=client.models.generate_content),
-    patch_type=StrPatch
-)
-
-tracer = phoenix_provider.get_tracer(__name__)
-
-async def string_test():
-    error = await target_object.validate_content()
-
-    if error:
-        target_object.current_error = error  # needed so the loop starts
-        create_method = client.models.generate_content
-        parse_method = client.models.generate_content
-        driver = PatchDriver(
-            target_object, 
-            create_method, 
-            parse_method, 
-            {'model': 'gemini-2.5-pro'}, 
-            GoogleGenAiAdapter()
-            )
-        await driver.run_patching_loop(messages)
-        print("===== ORIGINAL STATE =====")
-        print(target_object.content)
-        print("===== PATCHED STATE =====")
-        print(target_object.content)
-        print("=========================")
+def build_target(client) -> PatchTarget:
+    return PatchTarget(
+        object=DOC,
+        validation_condition=partial(validation_string_condition, call_llm=client.aio.models.generate_content),
+        patch_type=StrPatch
+    )
 
 if __name__ == "__main__":
-    asyncio.run(string_test())
\ No newline at end of file
+    client = setup_client()
+    asyncio.run(run_scenario(build_target(client), messages, client))
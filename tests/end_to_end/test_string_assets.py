@@ -392,7 +392,7 @@ async def validation_string_condition(current_doc: str, call_llm: Callable) -> s
         schema=Reflection
     )
 
-    response = adapter.parse_llm_output(call_llm(**llm_inputs, model="gemini-2.5-pro"))
+    response = adapter.parse_llm_output(await call_llm(**llm_inputs, model="gemini-2.5-pro"))
 
     if response.attached_object and isinstance(response.attached_object, Reflection):
         if response.attached_object.broken_rules:
@@ -8,16 +8,19 @@ from llm_patch_driver.patch.json.json_patch import JsonPatch
 
 SAMPLE_TEXT = "Hello world. How are you?\nAnother line."
 
-def test_build_map_and_original_roundtrip():
+@pytest.fixture(scope="module")
+def sent_map() -> SortedDict:
+    """Sentence map of SAMPLE_TEXT, built once; the tests only read it."""
+    return StrPatch.build_map(SAMPLE_TEXT)
+
+def test_build_map_and_original_roundtrip(sent_map: SortedDict):
     """Original text without whitespace differences should be reconstructable."""
-    sent_map = StrPatch.build_map(SAMPLE_TEXT)
     reconstructed = StrPatch.content_from_map(SAMPLE_TEXT, sent_map)
     assert reconstructed == SAMPLE_TEXT
 
 
-def test_map_to_annotated_text():
+def test_map_to_annotated_text(sent_map: SortedDict):
     """map_to_annotated_text should include sentence ids and preserve sentence order."""
-    sent_map = StrPatch.build_map(SAMPLE_TEXT)
     annotated = StrPatch.build_annotation(SAMPLE_TEXT, sent_map)
     expected = (
         "<tid=1_1>Hello world.</tid>\n"
@@ -1,8 +1,7 @@
 import json
-from copy import deepcopy
 
 import pytest
-import asyncio
+import jsonpatch
 from pydantic import ValidationError
 
 from llm_patch_driver.patch.json.json_patch import JsonPatch
@@ -25,26 +24,11 @@ class DummySchema(RootModel[dict]):
     root: dict
 
 
-def _get_a_id(target_lookup_map, json_pointer: str) -> int:
-    """Return attribute id (``a_id``) from target's internal map for a pointer."""
-
-    for a_id, pointer in target_lookup_map.items():  # pylint: disable=protected-access
-        if pointer == json_pointer:
-            return a_id
-    raise KeyError(
-        f"Could not find pointer {json_pointer} in target's map: {target_lookup_map}"
-    )
-
-
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture()
-
-def sample_json():
-    """Provide a fresh copy of the JSON document for every test."""
-
+def _sample_json() -> dict:
     return {
         "name": "Alice",
         "details": {
@@ -56,9 +40,27 @@ def sample_json():
 
 @pytest.fixture()
 
-def json_lookup_map(sample_json):
-    """Build a lookup map for the sample JSON without constructing `PatchTarget`."""
-    return JsonPatch.build_map(sample_json)
+def sample_json():
+    """Provide a fresh copy of the JSON document for every test."""
+
+    return _sample_json()
+
+
+@pytest.fixture(scope="module")
+
+def json_lookup_map():
+    """Build a lookup map for the sample JSON without constructing `PatchTarget`.
+
+    JsonPatch only reads the map, so one map is shared by the whole module.
+    """
+    return JsonPatch.build_map(_sample_json())
+
+
+@pytest.fixture(scope="module")
+
+def pointer_to_id(json_lookup_map):
+    """Invert the lookup map to find a pointer's attribute id (``a_id``)."""
+    return {pointer: a_id for a_id, pointer in json_lookup_map.items()}
 
 
 # ---------------------------------------------------------------------------
@@ -90,24 +92,24 @@ def test_json_patch_deserialization_invalid():
 # Patch application tests via PatchDriver
 # ---------------------------------------------------------------------------
 
-def test_replace_root_value(json_lookup_map, sample_json):
+def test_replace_root_value(json_lookup_map, pointer_to_id, sample_json):
     """Replacing a top-level scalar value works."""
 
-    name_id = _get_a_id(json_lookup_map, "/name")
+    name_id = pointer_to_id["/name"]
     patch = JsonPatch(op="replace", a_id=name_id, i_id=None, value="Bob")
-    dummy_target = type("T", (), {"content": deepcopy(sample_json), "_lookup_map": json_lookup_map})()
+    dummy_target = type("T", (), {"content": sample_json, "_lookup_map": json_lookup_map})()
     patch.apply_patch(dummy_target)  # type: ignore[arg-type]
     assert dummy_target.content["name"] == "Bob" # type: ignore[attr-defined]
 
 
-def test_add_list_element(json_lookup_map, sample_json):
+def test_add_list_element(json_lookup_map, pointer_to_id, sample_json):
     """Adding a new element to an array appends the value at the correct index."""
 
-    hobbies_id = _get_a_id(json_lookup_map, "/details/hobbies")
+    hobbies_id = pointer_to_id["/details/hobbies"]
     # existing list has 2 items – use index 3 (1-based) to append at the end
     patch = JsonPatch(op="add", a_id=hobbies_id, i_id=3, value="painting")
 
-    dummy_target = type("T", (), {"content": deepcopy(sample_json), "_lookup_map": json_lookup_map})()
+    dummy_target = type("T", (), {"content": sample_json, "_lookup_map": json_lookup_map})()
     patch.apply_patch(dummy_target)  # type: ignore[arg-type]
     assert dummy_target.content["details"]["hobbies"] == [ # type: ignore[attr-defined]
         "reading",
@@ -116,24 +118,24 @@ def test_add_list_element(json_lookup_map, sample_json):
     ] 
 
 
-def test_remove_object_key(json_lookup_map, sample_json):
+def test_remove_object_key(json_lookup_map, pointer_to_id, sample_json):
     """Removing a nested object attribute deletes the key."""
 
-    city_id = _get_a_id(json_lookup_map, "/details/city")
+    city_id = pointer_to_id["/details/city"]
     patch = JsonPatch(op="remove", a_id=city_id, i_id=None, value=None)
-    dummy_target = type("T", (), {"content": deepcopy(sample_json), "_lookup_map": json_lookup_map})()
+    dummy_target = type("T", (), {"content": sample_json, "_lookup_map": json_lookup_map})()
     patch.apply_patch(dummy_target)  # type: ignore[arg-type]
     assert "city" not in dummy_target.content["details"] # type: ignore[attr-defined]
 
 
-def test_remove_list_element(json_lookup_map, sample_json):
+def test_remove_list_element(json_lookup_map, pointer_to_id, sample_json):
     """Removing an element from a list updates the array correctly."""
 
-    hobbies_id = _get_a_id(json_lookup_map, "/details/hobbies")
+    hobbies_id = pointer_to_id["/details/hobbies"]
     # remove first element (index 1 -> underlying json pointer index 0)
     patch = JsonPatch(op="remove", a_id=hobbies_id, i_id=1, value=None)
 
-    dummy_target = type("T", (), {"content": deepcopy(sample_json), "_lookup_map": json_lookup_map})()
+    dummy_target = type("T", (), {"content": sample_json, "_lookup_map": json_lookup_map})()
     patch.apply_patch(dummy_target)  # type: ignore[arg-type]
     assert dummy_target.content["details"]["hobbies"] == ["chess"] # type: ignore[attr-defined]
 
@@ -143,13 +145,13 @@ def test_remove_list_element(json_lookup_map, sample_json):
 # ---------------------------------------------------------------------------
 
 
-def test_apply_multiple_json_patches_bundle(json_lookup_map, sample_json):
+def test_apply_multiple_json_patches_bundle(json_lookup_map, pointer_to_id, sample_json):
     """Applying several JsonPatch operations in a single bundle should yield the expected final state."""
 
     # Helper IDs for the JSON pointers we want to modify.
-    name_id = _get_a_id(json_lookup_map, "/name")
-    hobbies_id = _get_a_id(json_lookup_map, "/details/hobbies")
-    city_id = _get_a_id(json_lookup_map, "/details/city")
+    name_id = pointer_to_id["/name"]
+    hobbies_id = pointer_to_id["/details/hobbies"]
+    city_id = pointer_to_id["/details/city"]
 
     patch_replace_name = JsonPatch(op="replace", a_id=name_id, i_id=None, value="Bob")
     patch_add_hobby = JsonPatch(op="add", a_id=hobbies_id, i_id=3, value="painting")
@@ -158,7 +160,7 @@ def test_apply_multiple_json_patches_bundle(json_lookup_map, sample_json):
     # Provide patches in arbitrary order – JsonPatch.bundle_builder currently
     # preserves order, but the operations are independent so order should not
     # affect the final outcome.
-    dummy_target = type("T", (), {"content": deepcopy(sample_json), "_lookup_map": json_lookup_map})()
+    dummy_target = type("T", (), {"content": sample_json, "_lookup_map": json_lookup_map})()
     for p in [patch_remove_city, patch_add_hobby, patch_replace_name]:
         p.apply_patch(dummy_target)  # type: ignore[arg-type]
 
@@ -169,4 +171,30 @@ def test_apply_multiple_json_patches_bundle(json_lookup_map, sample_json):
         },
     }
 
-    assert dummy_target.content == expected_result # type: ignore[attr-defined]
\ No newline at end of file
+    assert dummy_target.content == expected_result # type: ignore[attr-defined]
+
+def test_append_to_string_value(json_lookup_map, pointer_to_id, sample_json):
+    """Appending extends an existing string instead of replacing it."""
+
+    city_id = pointer_to_id["/details/city"]
+    hobbies_id = pointer_to_id["/details/hobbies"]
+    patches = [
+        JsonPatch(op="append", a_id=city_id, i_id=None, value=" City"),
+        JsonPatch(op="append", a_id=hobbies_id, i_id=2, value=" club"),
+    ]
+
+    dummy_target = type("T", (), {"content": sample_json, "_lookup_map": json_lookup_map})()
+    for patch in patches:
+        patch.apply_patch(dummy_target)  # type: ignore[arg-type]
+
+    assert dummy_target.content["details"]["city"] == "Wonderland City" # type: ignore[attr-defined]
+    assert dummy_target.content["details"]["hobbies"] == ["reading", "chess club"] # type: ignore[attr-defined]
+
+    append_to_dict = JsonPatch(op="append", a_id=pointer_to_id["/details"], i_id=None, value="x")
+    with pytest.raises(jsonpatch.JsonPatchConflict):
+        append_to_dict.apply_patch(dummy_target)  # type: ignore[arg-type]
+
+def test_append_requires_string_value(pointer_to_id):
+    city_id = pointer_to_id["/details/city"]
+    with pytest.raises(ValidationError, match="requires a string 'value'"):
+        JsonPatch(op="append", a_id=city_id, i_id=None, value=3)
@@ -39,3 +39,21 @@ def test_responses_format_and_parse_roundtrip():
     assert parsed.content == "ok"
     assert parsed.tool_calls and parsed.tool_calls[0].name == "Echo"
 
+
+
+def test_chat_completions_parse_sdk_objects():
+    """Responses may be SDK objects instead of dicts; missing paths fall back to defaults."""
+    from types import SimpleNamespace as NS
+
+    adapter = OpenAIChatCompletions()
+    tool_call = NS(type="function", id="call_1", function=NS(name="Echo", arguments="{}"))
+    raw = NS(choices=[NS(message=NS(role="assistant", content="ok", tool_calls=[tool_call]))])
+
+    parsed = adapter.parse_llm_output(raw)
+    assert parsed.content == "ok"
+    assert parsed.tool_calls[0].id == "call_1"
+    assert parsed.tool_calls[0].arguments == "{}"
+
+    empty = adapter.parse_llm_output({"choices": []})
+    assert empty.role == "assistant"
+    assert empty.tool_calls == []
@@ -10,11 +10,12 @@ import asyncio
 from typing import Any, Dict, List, Optional, Type
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, RootModel
 
 from llm_patch_driver.driver.driver import PatchDriver
 from llm_patch_driver.patch_target.target import PatchTarget
 from llm_patch_driver.patch.string.string_patch import StrPatch
+from llm_patch_driver.patch.json.json_patch import JsonPatch
 from llm_patch_driver.llm.base_adapter import BaseApiAdapter
 from llm_patch_driver.llm.schemas import Message, ToolCallRequest
 from llm_patch_driver.llm.base_tool import LLMTool
@@ -57,30 +58,45 @@ def _fake_parse(**kwargs):
     return {"choices": [{"message": {"role": "assistant", "content": "hi"}}]}
 
 
-def test_call_llm_uses_adapter_format_and_parse():
-    target = PatchTarget(object="hello world", patch_type=StrPatch)
-    driver = PatchDriver(
-        target_object=target,
-        create_method=_fake_create,
-        parse_method=_fake_parse,
-        api_adapter=DummyAdapter(),
-        tools=[],
-    )
+def _recorder():
+    """Return an LLM method that records the kwargs of every call, and the list it records into."""
+    calls: List[dict] = []
+
+    async def _record(**kwargs):
+        calls.append(kwargs)
+        return {}
+
+    return _record, calls
+
+
+def _make_driver(target: Optional[PatchTarget] = None, **kwargs) -> PatchDriver:
+    """Build a driver over ``target`` (plain text by default) with fake LLM methods.
+
+    Keyword arguments replace the fakes or set other driver options.
+    """
+    if target is None:
+        target = PatchTarget(object="hello world", patch_type=StrPatch)
+    kwargs = {
+        "create_method": _fake_create,
+        "parse_method": _fake_parse,
+        "api_adapter": DummyAdapter(),
+        "tools": [],
+        **kwargs,
+    }
+    return PatchDriver(target_object=target, **kwargs)
 
-    msg = asyncio.run(driver.call_llm(messages=[Message(role="user", content="hello")]))
+
+@pytest.mark.asyncio
+async def test_call_llm_uses_adapter_format_and_parse():
+    driver = _make_driver()
+
+    msg = await driver.call_llm(messages=[Message(role="user", content="hello")])
     assert isinstance(msg, Message)
     assert msg.role == "assistant"
 
 
 def test_bind_tool_registers_schema():
-    target = PatchTarget(object="hello world", patch_type=StrPatch)
-    driver = PatchDriver(
-        target_object=target,
-        create_method=_fake_create,
-        parse_method=_fake_parse,
-        api_adapter=DummyAdapter(),
-        tools=[],
-    )
+    driver = _make_driver()
 
     class EchoTool(LLMTool):
         text: str
@@ -91,3 +107,251 @@ def test_bind_tool_registers_schema():
     driver.bind_tool(EchoTool)
     # The internal _tools should have one formatted schema entry
     assert any(s.get("name") == "EchoTool" for s in driver._tools)  # type: ignore[attr-defined]
+
+
+def _failing_then_valid(failures: int):
+    """Return a validation condition that fails ``failures`` times, then passes."""
+    calls = {"n": 0}
+
+    def condition(value: str):
+        calls["n"] += 1
+        return "still invalid" if calls["n"] <= failures else None
+
+    return condition
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("keep_state_history, expected_growth", [(True, 2), (False, 1)])
+async def test_patching_loop_state_history(keep_state_history, expected_growth):
+    create, create_calls = _recorder()
+    target = PatchTarget(
+        object="hello world",
+        patch_type=StrPatch,
+        validation_condition=_failing_then_valid(1),
+        current_error="invalid",
+    )
+    driver = _make_driver(target, create_method=create, keep_state_history=keep_state_history)
+
+    await driver.run_patching_loop([{"role": "user", "content": "task"}])
+
+    first, second = (call["messages"] for call in create_calls)
+    # each cycle appends the assistant reply, plus the elided state when kept
+    assert len(second) - len(first) == expected_growth
+    assert "still invalid" in second[-1]["content"]
+
+
+class BundleAdapter(DummyAdapter):
+    def parse_llm_output(self, raw_response: Any) -> Message:
+        return Message(role="assistant", attached_object={"patches": []})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("patch_cache_size, expected_calls", [(0, 2), (8, 1)])
+async def test_request_patch_bundle_cache(patch_cache_size, expected_calls):
+    parse, parse_calls = _recorder()
+    driver = _make_driver(parse_method=parse, api_adapter=BundleAdapter(), patch_cache_size=patch_cache_size)
+
+    for _ in range(2):
+        bundle = await driver.request_patch_bundle("fix it", "context")
+        assert bundle.patches == []
+
+    assert len(parse_calls) == expected_calls
+
+
+class EchoBundleAdapter(DummyAdapter):
+    def parse_llm_output(self, raw_response: Any) -> Message:
+        return Message(role="assistant", attached_object=raw_response)
+
+
+def _patches_by_query(responses: Dict[str, list]):
+    """Parse method that answers each request with the patches listed for its query."""
+    in_flight = {"now": 0, "peak": 0}
+
+    async def _parse(**kwargs):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0)
+        in_flight["now"] -= 1
+
+        prompt = kwargs["messages"][0]["content"]
+        query = next(q for q in responses if q in prompt)
+        return {"patches": responses[query]}
+
+    return _parse, in_flight
+
+
+class AnyDocument(RootModel[dict]):
+    root: dict
+
+
+@pytest.mark.asyncio
+async def test_request_patch_bundles_merges_results():
+    parse, in_flight = _patches_by_query({
+        "query-a": [{"tids": ["1_1"], "operation": {"type": "replace", "pattern": "Hello", "replacement": "Hi"}}],
+        "query-b": [{"tids": ["2_1"], "operation": {"type": "delete"}}],
+        "query-c": [{"tids": ["1_2"], "operation": {"type": "replace", "pattern": "Bye", "replacement": "See you"}}],
+    })
+
+    target = PatchTarget(object="Hello world. Bye now.\nSecond line.", patch_type=StrPatch)
+    driver = _make_driver(target, parse_method=parse, api_adapter=EchoBundleAdapter())
+
+    requests = [("query-a", "ctx"), ("query-b", "ctx"), ("query-c", "ctx")]
+    bundle = await driver.request_patch_bundles(requests, max_concurrency=2)
+
+    assert len(bundle.patches) == 3
+    assert in_flight["peak"] == 2
+
+    await target.apply_patches(bundle.patches)
+    assert target.content == "Hi world. See you now."
+
+
+@pytest.mark.asyncio
+async def test_request_patch_bundles_rejects_overlapping_tids():
+    parse, _ = _patches_by_query({
+        "query-a": [{"tids": ["1_1"], "operation": {"type": "replace", "pattern": "Hello", "replacement": "Hi"}}],
+        "query-b": [{"tids": ["1_1"], "operation": {"type": "delete"}}],
+    })
+
+    target = PatchTarget(object="Hello world. Bye now.", patch_type=StrPatch)
+    driver = _make_driver(target, parse_method=parse, api_adapter=EchoBundleAdapter())
+
+    with pytest.raises(ValueError, match="overlap at tid '1_1'"):
+        await driver.request_patch_bundles([("query-a", "ctx"), ("query-b", "ctx")])
+
+
+def _json_driver(document: dict, responses: Dict[str, list]) -> PatchDriver:
+    parse, _ = _patches_by_query(responses)
+    target = PatchTarget(object=document, patch_type=JsonPatch, validation_schema=AnyDocument)
+    return _make_driver(target, parse_method=parse, api_adapter=EchoBundleAdapter())
+
+
+@pytest.mark.asyncio
+async def test_request_patch_bundles_orders_json_index_operations():
+    document = {"tags": ["a", "b", "c"], "city": "Paris"}
+    ids = {pointer: a_id for a_id, pointer in JsonPatch.build_map(document).items()}
+
+    driver = _json_driver(document, {
+        "query-a": [{"op": "remove", "a_id": ids["/tags"], "i_id": 1, "value": None}],
+        "query-b": [
+            {"op": "remove", "a_id": ids["/tags"], "i_id": 2, "value": None},
+            {"op": "replace", "a_id": ids["/city"], "i_id": None, "value": "Rome"},
+        ],
+    })
+
+    bundle = await driver.request_patch_bundles([("query-a", "ctx"), ("query-b", "ctx")])
+    await driver.target_object.apply_patches(bundle.patches)
+
+    # both indices refer to the original list, so "a" and "b" are removed
+    assert driver.target_object.content == {"tags": ["c"], "city": "Rome"}
+
+
+@pytest.mark.asyncio
+async def test_request_patch_bundles_rejects_nested_json_overlap():
+    document = {"details": {"city": "Paris"}}
+    ids = {pointer: a_id for a_id, pointer in JsonPatch.build_map(document).items()}
+
+    driver = _json_driver(document, {
+        "query-a": [{"op": "replace", "a_id": ids["/details"], "i_id": None, "value": {"city": "Rome"}}],
+        "query-b": [{"op": "replace", "a_id": ids["/details/city"], "i_id": None, "value": "Oslo"}],
+    })
+
+    with pytest.raises(ValueError, match="overlap at '/details/city'"):
+        await driver.request_patch_bundles([("query-a", "ctx"), ("query-b", "ctx")])
+
+
+@pytest.mark.asyncio
+async def test_request_patch_bundles_rejects_paths_under_shifted_array():
+    document = {"items": [{"n": 1}, {"n": 2}, {"n": 3}]}
+    ids = {pointer: a_id for a_id, pointer in JsonPatch.build_map(document).items()}
+
+    driver = _json_driver(document, {
+        "query-a": [{"op": "remove", "a_id": ids["/items"], "i_id": 1, "value": None}],
+        "query-b": [{"op": "replace", "a_id": ids["/items/2/n"], "i_id": None, "value": 30}],
+    })
+
+    with pytest.raises(ValueError, match="adds or removes items of '/items'"):
+        await driver.request_patch_bundles([("query-a", "ctx"), ("query-b", "ctx")])
+    assert driver.target_object.content == document
+
+
+@pytest.mark.asyncio
+async def test_request_patch_bundles_inserts_below_a_deleted_line():
+    parse, _ = _patches_by_query({
+        "query-a": [{"tids": ["1_1"], "operation": {"type": "delete"}}],
+        "query-b": [{"tids": ["2_1"], "operation": {"type": "insert_after", "text": "X."}}],
+    })
+
+    target = PatchTarget(object="A.\nB.\nC.", patch_type=StrPatch)
+    driver = _make_driver(target, parse_method=parse, api_adapter=EchoBundleAdapter())
+
+    bundle = await driver.request_patch_bundles([("query-a", "ctx"), ("query-b", "ctx")])
+    await target.apply_patches(bundle.patches)
+
+    assert target.content == "B.\nX.\nC."
+
+
+@pytest.mark.asyncio
+async def test_request_model_args_apply_only_to_patch_requests():
+    create, create_calls = _recorder()
+    parse, parse_calls = _recorder()
+    driver = _make_driver(
+        create_method=create,
+        parse_method=parse,
+        api_adapter=BundleAdapter(),
+        model_args={"model": "m", "max_tokens": 4096},
+        request_model_args={"max_tokens": 1024},
+    )
+
+    await driver.call_llm(messages=[Message(role="user", content="hello")])
+    await driver.request_patch_bundle("fix it", "context")
+
+    assert create_calls[0]["max_tokens"] == 4096
+    assert parse_calls[0]["max_tokens"] == 1024
+    assert parse_calls[0]["model"] == "m"
+
+
+@pytest.mark.asyncio
+async def test_patching_loop_history_is_append_only():
+    create, create_calls = _recorder()
+    target = PatchTarget(
+        object="hello world",
+        patch_type=StrPatch,
+        validation_condition=_failing_then_valid(2),
+        current_error="invalid",
+    )
+    driver = _make_driver(target, create_method=create)
+
+    await driver.run_patching_loop([{"role": "user", "content": "task"}])
+
+    sent_messages = [call["messages"] for call in create_calls]
+    assert len(sent_messages) == 3
+    for previous, current in zip(sent_messages, sent_messages[1:]):
+        # everything but the trailing debugging state is resent unchanged
+        assert current[: len(previous) - 1] == previous[:-1]
+
+
+@pytest.mark.asyncio
+async def test_max_prompt_tokens_rejects_oversized_prompt():
+    create, create_calls = _recorder()
+    driver = _make_driver(create_method=create, max_prompt_tokens=5, token_counter=lambda text: len(text.split()))
+
+    await driver.call_llm(messages=[Message(role="user", content="short prompt")])
+    with pytest.raises(ValueError, match="max_prompt_tokens"):
+        await driver.call_llm(messages=[Message(role="user", content="one two three four five six")])
+
+    assert len(create_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_max_prompt_tokens_counts_tools_and_schema():
+    class Answer(BaseModel):
+        verdict: str = Field(description="word " * 20)
+
+    driver = _make_driver(max_prompt_tokens=10, token_counter=lambda text: len(text.split()))
+    messages = [Message(role="user", content="short prompt")]
+
+    await driver.call_llm(messages=messages)
+    with pytest.raises(ValueError, match="max_prompt_tokens"):
+        await driver.call_llm(messages=messages, tools=[{"description": "word " * 20}])
+    with pytest.raises(ValueError, match="max_prompt_tokens"):
+        await driver.call_llm(messages=messages, schema=Answer)
@@ -1,9 +1,8 @@
 import pytest
-import asyncio
 from pydantic import BaseModel, ValidationError
 
 from llm_patch_driver.patch_target.target import PatchTarget
-from llm_patch_driver.patch.string.string_patch import StrPatch
+from llm_patch_driver.patch.string.string_patch import StrPatch, ReplaceOp
 from llm_patch_driver.patch.base_patch import BasePatch
 PatchTarget.model_rebuild(_types_namespace={"BasePatch": BasePatch})
 
@@ -94,14 +93,37 @@ async def async_condition(value: str):
 
 
 @pytest.mark.asyncio
-async def test_validate_content_with_sync_condition():
-    pt = PatchTarget(object="invalid", validation_condition=sync_condition, patch_type=StrPatch)
+@pytest.mark.parametrize(
+    "condition, expected",
+    [(sync_condition, "sync error"), (async_condition, "async error")],
+)
+async def test_validate_content_with_condition(condition, expected):
+    pt = PatchTarget(object="invalid", validation_condition=condition, patch_type=StrPatch)
     result = await pt.validate_content()
-    assert result == "sync error"
+    assert result == expected
+
+# --------------------------------------------------------------------- #
+# ANNOTATION TESTS
+# --------------------------------------------------------------------- #
+
+def test_annotated_content_matches_template():
+    """The spliced annotation renders exactly like the template substitution."""
+    pt = PatchTarget(object="Costs $5. Then {more}.", patch_type=StrPatch)
+    expected = StrPatch.prompts.annotation_template.substitute(object_content=str(pt._annotated))
+    assert pt.annotated_content == expected
+    assert pt.annotated_content is pt.annotated_content
 
 
 @pytest.mark.asyncio
-async def test_validate_content_with_async_condition():
-    pt = PatchTarget(object="invalid", validation_condition=async_condition, patch_type=StrPatch)
-    result = await pt.validate_content()
-    assert result == "async error"
\ No newline at end of file
+async def test_debugging_message_follows_state_changes():
+    """The cached debugging state is rebuilt when the error or the content changes."""
+    pt = PatchTarget(object="Hello world.", patch_type=StrPatch, current_error="first")
+    first = pt.debugging_message.content
+    assert pt.debugging_message.content is first
+
+    pt.current_error = "second"
+    assert "second" in pt.debugging_message.content
+
+    patch = StrPatch(tids=["1_1"], operation=ReplaceOp(pattern="Hello", replacement="Bye"))
+    await pt.apply_patches([patch])
+    assert "Bye world." in pt.debugging_message.content
@@ -0,0 +1,71 @@
+"""Unit tests for the prompt modules.
+
+The prompts the driver sends must be distinct, non-empty texts, so a bad merge
+cannot leave one prompt standing in for another. `PatchPrompts` must render
+annotation templates given either as a str or as a string.Template.
+"""
+
+from string import Template
+
+import pytest
+
+from llm_patch_driver.driver.prompts import PATCH_SYNTAX_PROMPT, PATCHING_LOOP_SYSTEM_PROMPT, REQUEST_PATCH_PROMPT
+from llm_patch_driver.patch.base_patch import PatchPrompts
+from llm_patch_driver.patch.json.json_patch import JsonPatch
+from llm_patch_driver.patch.string.string_patch import StrPatch
+
+
+def test_driver_prompts_are_distinct():
+    prompts = [
+        REQUEST_PATCH_PROMPT,
+        PATCHING_LOOP_SYSTEM_PROMPT,
+        PATCH_SYNTAX_PROMPT,
+        StrPatch.prompts.syntax,
+        JsonPatch.prompts.syntax,
+    ]
+    texts = [(p.template if isinstance(p, Template) else p).strip() for p in prompts]
+
+    assert all(texts)
+    assert len(set(texts)) == len(texts)
+
+
+def _prompts(annotation_template) -> PatchPrompts:
+    return PatchPrompts(
+        syntax="",
+        annotation_template=annotation_template,
+        annotation_placeholder="",
+        modify_tool_doc="",
+        reset_tool_doc="",
+        request_tool_doc="",
+    )
+
+
+@pytest.mark.parametrize(
+    "annotation_template",
+    [
+        "<state>{object_content}</state>",
+        "<state>$object_content</state>",
+        Template("<state>$object_content</state>"),
+    ],
+)
+def test_patch_prompts_accept_str_and_template(annotation_template):
+    assert _prompts(annotation_template).render_annotation("X") == "<state>X</state>"
+
+
+@pytest.mark.parametrize(
+    "annotation_template",
+    [
+        Template("cost $$5 $object_content"),
+        Template("cost $$5 ${object_content}"),
+        "cost $5 {object_content}",
+    ],
+)
+def test_patch_prompts_render_matches_substitute(annotation_template):
+    prompts = _prompts(annotation_template)
+    assert prompts.render_annotation("X") == "cost $5 X"
+    assert prompts.render_annotation("X") == prompts.annotation_template.substitute(object_content="X")
+
+
+def test_patch_prompts_require_object_content_once():
+    with pytest.raises(ValueError, match="exactly once"):
+        _prompts(Template("$object_content and $object_content"))
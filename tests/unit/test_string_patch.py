@@ -8,7 +8,7 @@ Covers:
 """
 
 import json
-import asyncio
+from types import SimpleNamespace
 
 import pytest
 from pydantic import ValidationError
@@ -100,7 +100,8 @@ def test_str_patch_deserialization_invalid():
 # ---------------------------------------------------------------------------
 
 
-def test_apply_replace_patch(target: PatchTarget[str]):
+@pytest.mark.asyncio
+async def test_apply_replace_patch(target: PatchTarget[str]):
     """Applying a simple replace patch should update the text content."""
 
     patch = ConcreteStrPatch(
@@ -109,7 +110,7 @@ def test_apply_replace_patch(target: PatchTarget[str]):
     )
 
     # Apply patch via target
-    asyncio.run(target.apply_patches([patch]))
+    await target.apply_patches([patch])
 
     expected_text = "Hello ChatGPT.\nThis is a test."
     assert target.content == expected_text
@@ -121,7 +122,8 @@ def test_apply_replace_patch(target: PatchTarget[str]):
 
 
 
-def test_apply_delete_patch(target: PatchTarget[str]):
+@pytest.mark.asyncio
+async def test_apply_delete_patch(target: PatchTarget[str]):
     """Deleting a sentence should remove the corresponding line from the text."""
 
     # Delete the first (and only) sentence of the first line.
@@ -129,28 +131,30 @@ def test_apply_delete_patch(target: PatchTarget[str]):
         tids=["1_1"],
         operation=DeleteOp(),
     )
-    asyncio.run(target.apply_patches([patch]))
+    await target.apply_patches([patch])
 
     expected_text = "This is a test."
     assert target.content == expected_text
 
 
 
-def test_apply_insert_after_patch(target: PatchTarget[str]):
+@pytest.mark.asyncio
+async def test_apply_insert_after_patch(target: PatchTarget[str]):
     """Inserting text after a given line should shift subsequent lines down."""
 
     patch = ConcreteStrPatch(
         tids=["1_1"],
         operation=InsertAfterOp(text="New line."),
     )
-    asyncio.run(target.apply_patches([patch]))
+    await target.apply_patches([patch])
 
     expected_text = "Hello world.\nNew line.\nThis is a test."
     assert target.content == expected_text
 
 
 
-def test_apply_multiple_patches_bundle(target: PatchTarget[str]):
+@pytest.mark.asyncio
+async def test_apply_multiple_patches_bundle(target: PatchTarget[str]):
     """Applying a bundle containing multiple patch types should yield the correct final text.
 
     The patches are intentionally provided in a non-optimal order to ensure that
@@ -182,7 +186,104 @@ def test_apply_multiple_patches_bundle(target: PatchTarget[str]):
 
     sorted_patches = sorted(patches, key=lambda p: (priority.get(p.operation.type, 99), -_anchor_line(p)))
 
-    asyncio.run(target.apply_patches(sorted_patches)) # type: ignore[arg-type]
+    await target.apply_patches(sorted_patches) # type: ignore[arg-type]
 
     expected_text = "Hi world.\nNew line."
-    assert target.content == expected_text
\ No newline at end of file
+    assert target.content == expected_text
+
+def test_build_map_only_sentencizes_new_lines(monkeypatch: pytest.MonkeyPatch):
+    """Rebuilding the map after an edit runs spaCy only on lines it has not seen."""
+    nlp = StrPatch._get_nlp()
+    piped: list[str] = []
+
+    class RecordingNlp:
+        def pipe(self, lines):
+            piped.extend(lines)
+            return nlp.pipe(lines)
+
+    monkeypatch.setattr(StrPatch, "_NLP", RecordingNlp())
+    monkeypatch.setattr(StrPatch, "_SENT_CACHE", type(StrPatch._SENT_CACHE)())
+
+    first = StrPatch.build_map("Alpha one. Alpha two.\nBeta line.")
+    second = StrPatch.build_map("Alpha one. Alpha two.\nGamma line.")
+
+    assert piped == ["Alpha one. Alpha two.", "Beta line.", "Gamma line."]
+    assert dict(first[1]) == dict(second[1]) == {1: "Alpha one. ", 2: "Alpha two."}
+    assert dict(second[2]) == {1: "Gamma line."}
+
+
+def test_build_map_drops_cached_splits_when_pipeline_changes(monkeypatch: pytest.MonkeyPatch):
+    """Switching to another pipeline re-segments lines cached by the previous one."""
+    nlp = StrPatch._get_nlp()
+
+    class WholeLineNlp:
+        def pipe(self, lines):
+            for line in lines:
+                doc = nlp.make_doc(line)
+                yield SimpleNamespace(sents=[doc[:]])
+
+    monkeypatch.setattr(StrPatch, "_SENT_CACHE", type(StrPatch._SENT_CACHE)())
+    assert dict(StrPatch.build_map("One. Two.")[1]) == {1: "One. ", 2: "Two."}
+
+    # what a user does to switch models after the first map was built
+    monkeypatch.setattr(StrPatch, "use_statistical_model", True)
+    monkeypatch.setattr(StrPatch, "_NLP", WholeLineNlp())
+
+    assert dict(StrPatch.build_map("One. Two.")[1]) == {1: "One. Two."}
+
+
+def test_build_map_keeps_subclass_pipelines_apart(monkeypatch: pytest.MonkeyPatch):
+    """A subclass with its own pipeline never reads splits cached by another one."""
+    nlp = StrPatch._get_nlp()
+
+    class WholeLineNlp:
+        def pipe(self, lines):
+            for line in lines:
+                doc = nlp.make_doc(line)
+                yield SimpleNamespace(sents=[doc[:]])
+
+    class WholeLinePatch(StrPatch):
+        _NLP = WholeLineNlp()
+
+    monkeypatch.setattr(StrPatch, "_SENT_CACHE", type(StrPatch._SENT_CACHE)())
+
+    for _ in range(2):
+        assert dict(StrPatch.build_map("One. Two.")[1]) == {1: "One. ", 2: "Two."}
+        assert dict(WholeLinePatch.build_map("One. Two.")[1]) == {1: "One. Two."}
+
+
+def test_bundle_schema_is_built_once():
+    assert StrPatch.get_bundle_schema() is StrPatch.get_bundle_schema()
+
+
+@pytest.mark.asyncio
+async def test_bundle_merges_deletes_on_the_same_line():
+    target = PatchTarget[str](object="One. Two. Three.\nFour.", patch_type=StrPatch)
+    bundle = StrPatch.get_bundle_schema()(
+        patches=[
+            StrPatch(tids=["1_1"], operation=DeleteOp()),
+            StrPatch(tids=["1_3"], operation=DeleteOp()),
+        ]
+    )
+
+    assert len(bundle.patches) == 1
+    await target.apply_patches(bundle.patches)
+    assert target.content == "Two. \nFour."
+
+
+def test_constructed_patches_can_be_sorted():
+    patches = [
+        StrPatch.model_construct(tids=["1_1"], operation=InsertAfterOp(text="New.")),
+        StrPatch.model_construct(tids=["2_1"], operation=DeleteOp()),
+        StrPatch.model_construct(tids=["1_1"], operation=ReplaceOp(pattern="a", replacement="b")),
+    ]
+
+    bundle = StrPatch.get_bundle_schema()(patches=patches)
+
+    assert [p.operation.type for p in bundle.patches] == ["replace", "delete", "insert_after"]
+    assert bundle.patches[1]._parsed_tids == [(2, 1)]
+
+
+def test_constructed_patches_reject_invalid_tids():
+    with pytest.raises(ValueError, match="Invalid tid format 'one'"):
+        StrPatch.model_construct(tids=["one"], operation=DeleteOp())